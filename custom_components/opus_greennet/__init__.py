@@ -58,10 +58,10 @@ def _get_coordinator(
     hass: HomeAssistant, config_entry_id: str | None = None
 ) -> OpusGreenNetCoordinator:
     """Get coordinator, optionally by config entry ID."""
-    if config_entry_id and config_entry_id in hass.data.get(DOMAIN, {}):
-        return hass.data[DOMAIN][config_entry_id]
-    # Return the first (and usually only) coordinator
     coordinators = hass.data.get(DOMAIN, {})
+    if config_entry_id and config_entry_id in coordinators:
+        return coordinators[config_entry_id]
+    # Return the first (and usually only) coordinator
     if not coordinators:
         raise ValueError("No Opus GreenNet integration configured")
     return next(iter(coordinators.values()))
@@ -128,14 +128,20 @@ async def async_update_options(hass: HomeAssistant, entry: ConfigEntry) -> None:
     await hass.config_entries.async_reload(entry.entry_id)
 
 
-def _register_services(hass: HomeAssistant) -> None:
-    """Register Opus GreenNet services."""
+class _OpusServices:
+    """Handlers for the Opus GreenNet domain services."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the service handlers."""
+        self.hass = hass
 
-    async def handle_get_device_configuration(call: ServiceCall) -> dict[str, Any] | None:
+    async def get_device_configuration(
+        self, call: ServiceCall
+    ) -> dict[str, Any] | None:
         """Handle get_device_configuration service call."""
         device_id = call.data[ATTR_DEVICE_ID]
         config_entry_id = call.data.get(ATTR_CONFIG_ENTRY_ID)
-        coordinator = _get_coordinator(hass, config_entry_id)
+        coordinator = _get_coordinator(self.hass, config_entry_id)
         result = await coordinator.async_get_device_configuration(device_id)
         if result is not None:
             _LOGGER.info(
@@ -143,12 +149,12 @@ def _register_services(hass: HomeAssistant) -> None:
             )
         return result
 
-    async def handle_set_device_configuration(call: ServiceCall) -> None:
+    async def set_device_configuration(self, call: ServiceCall) -> None:
         """Handle set_device_configuration service call."""
         device_id = call.data[ATTR_DEVICE_ID]
         configuration = call.data[ATTR_CONFIGURATION]
         config_entry_id = call.data.get(ATTR_CONFIG_ENTRY_ID)
-        coordinator = _get_coordinator(hass, config_entry_id)
+        coordinator = _get_coordinator(self.hass, config_entry_id)
         success = await coordinator.async_set_device_configuration(
             device_id, configuration
         )
@@ -157,47 +163,55 @@ def _register_services(hass: HomeAssistant) -> None:
         else:
             _LOGGER.error("Failed to set device configuration for %s", device_id)
 
-    async def handle_get_device_parameters(call: ServiceCall) -> dict[str, Any] | None:
+    async def get_device_parameters(
+        self, call: ServiceCall
+    ) -> dict[str, Any] | None:
         """Handle get_device_parameters service call."""
         device_id = call.data[ATTR_DEVICE_ID]
         config_entry_id = call.data.get(ATTR_CONFIG_ENTRY_ID)
-        coordinator = _get_coordinator(hass, config_entry_id)
+        coordinator = _get_coordinator(self.hass, config_entry_id)
         result = await coordinator.async_get_device_parameters(device_id)
         if result is not None:
             _LOGGER.info("Device parameters for %s: %s", device_id, result)
         return result
 
-    async def handle_reload_entry(call: ServiceCall) -> None:
+    async def reload_entry(self, call: ServiceCall) -> None:
         """Handle reload_entry service call — re-runs setup/teardown."""
         config_entry_id = call.data.get(ATTR_CONFIG_ENTRY_ID)
         if config_entry_id:
-            await hass.config_entries.async_reload(config_entry_id)
+            await self.hass.config_entries.async_reload(config_entry_id)
         else:
-            for eid in list(hass.data.get(DOMAIN, {}).keys()):
-                await hass.config_entries.async_reload(eid)
+            # Snapshot: reloading removes the entry from hass.data
+            for eid in tuple(self.hass.data.get(DOMAIN, ())):
+                await self.hass.config_entries.async_reload(eid)
+
+
+def _register_services(hass: HomeAssistant) -> None:
+    """Register Opus GreenNet services."""
+    services = _OpusServices(hass)
 
     hass.services.async_register(
         DOMAIN,
         SERVICE_GET_DEVICE_CONFIG,
-        handle_get_device_configuration,
+        services.get_device_configuration,
         schema=SERVICE_DEVICE_SCHEMA,
     )
     hass.services.async_register(
         DOMAIN,
         SERVICE_SET_DEVICE_CONFIG,
-        handle_set_device_configuration,
+        services.set_device_configuration,
         schema=SERVICE_SET_CONFIG_SCHEMA,
     )
     hass.services.async_register(
         DOMAIN,
         SERVICE_GET_DEVICE_PARAMS,
-        handle_get_device_parameters,
+        services.get_device_parameters,
         schema=SERVICE_DEVICE_SCHEMA,
     )
     hass.services.async_register(
         DOMAIN,
         SERVICE_RELOAD_ENTRY,
-        handle_reload_entry,
+        services.reload_entry,
         schema=vol.Schema(
             {vol.Optional(ATTR_CONFIG_ENTRY_ID): cv.string}
         ),
@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import logging
+from operator import attrgetter
 
 from homeassistant.components.binary_sensor import (
     BinarySensorDeviceClass,
@@ -14,11 +15,7 @@ from homeassistant.helpers.entity import DeviceInfo, EntityCategory
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .const import CONF_EAG_ID, DEFAULT_CHANNEL, DOMAIN
-from .coordinator import (
-    SIGNAL_DEVICE_DISCOVERED,
-    SIGNAL_DEVICE_STATE_UPDATE,
-    OpusGreenNetCoordinator,
-)
+from .coordinator import OpusGreenNetCoordinator
 from .enocean_device import EnOceanDevice
 
 _LOGGER = logging.getLogger(__name__)
@@ -33,11 +30,10 @@ async def async_setup_entry(
     coordinator: OpusGreenNetCoordinator = hass.data[DOMAIN][entry.entry_id]
     eag_id = entry.data[CONF_EAG_ID]
 
-    @callback
-    def async_add_binary_sensors(device: EnOceanDevice) -> None:
-        """Add binary sensor entities for a discovered device."""
+    def build_entities(device: EnOceanDevice) -> list[BinarySensorEntity]:
+        """Build the binary sensor entities for a device."""
         if not device.is_climate:
-            return
+            return []
 
         entities: list[BinarySensorEntity] = []
 
@@ -109,20 +105,30 @@ async def async_setup_entry(
                 )
             )
 
-        async_add_entities(entities)
+        return entities
 
-    # Listen for new device discoveries
+    @callback
+    def async_add_binary_sensors(device: EnOceanDevice) -> None:
+        """Add binary sensor entities for a discovered device."""
+        if entities := build_entities(device):
+            async_add_entities(entities)
+
+    # Listen for new climate device discoveries
     entry.async_on_unload(
         async_dispatcher_connect(
             hass,
-            f"{SIGNAL_DEVICE_DISCOVERED}_{eag_id}",
+            coordinator.climate_discovery_signal,
             async_add_binary_sensors,
         )
     )
 
-    # Add entities for already discovered devices
-    for device in coordinator.devices.values():
-        async_add_binary_sensors(device)
+    # Add entities for already discovered devices in a single batch
+    if entities := [
+        entity
+        for device in coordinator.binary_sensor_devices
+        for entity in build_entities(device)
+    ]:
+        async_add_entities(entities)
 
 
 class OpusGreenNetBaseBinarySensor(BinarySensorEntity):
@@ -143,18 +149,16 @@ class OpusGreenNetBaseBinarySensor(BinarySensorEntity):
         self._eag_id = eag_id
         self._device = device
         self._device_key = device.friendly_id or device.device_id
+        self._channel = device.get_channel(DEFAULT_CHANNEL)
+        self._last_is_on: bool | None = None
         self._attr_unique_id = f"{eag_id}_{device.device_id}_{suffix}"
         self._attr_name = name
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device info."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, f"{self._eag_id}_{self._device.device_id}")},
-            name=self._device.friendly_id or self._device.device_id,
-            manufacturer=self._device.manufacturer or "EnOcean",
-            model=self._device.primary_eep or "Unknown",
-            via_device=(DOMAIN, self._eag_id),
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, f"{eag_id}_{device.device_id}")},
+            name=self._device_key,
+            manufacturer=device.manufacturer or "EnOcean",
+            model=device.primary_eep or "Unknown",
+            via_device=(DOMAIN, eag_id),
         )
 
     @property
@@ -164,11 +168,10 @@ class OpusGreenNetBaseBinarySensor(BinarySensorEntity):
 
     async def async_added_to_hass(self) -> None:
         """Register callbacks when entity is added."""
+        self._last_is_on = self.is_on
         self.async_on_remove(
-            async_dispatcher_connect(
-                self.hass,
-                f"{SIGNAL_DEVICE_STATE_UPDATE}_{self._eag_id}_{self._device_key}",
-                self._handle_state_update,
+            self._coordinator.register_listener(
+                self._device_key, self._handle_state_update
             )
         )
 
@@ -176,6 +179,13 @@ class OpusGreenNetBaseBinarySensor(BinarySensorEntity):
     def _handle_state_update(self, device: EnOceanDevice) -> None:
         """Handle state update from coordinator."""
         self._device = device
+        self._channel = device.get_channel(DEFAULT_CHANNEL)
+
+        # Re-announcements often carry no change; skip the state write then
+        is_on = self.is_on
+        if is_on == self._last_is_on:
+            return
+        self._last_is_on = is_on
         self.async_write_ha_state()
 
 
@@ -196,7 +206,7 @@ class OpusGreenNetWindowSensor(OpusGreenNetBaseBinarySensor):
     @property
     def is_on(self) -> bool | None:
         """Return true if window is open."""
-        channel = self._device.channels.get(DEFAULT_CHANNEL)
+        channel = self._channel
         if channel:
             return channel.window_open
         return None
@@ -219,15 +229,15 @@ class OpusGreenNetProblemSensor(OpusGreenNetBaseBinarySensor):
     ) -> None:
         """Initialize the problem sensor."""
         super().__init__(coordinator, eag_id, device, suffix, name)
-        self._attr_name_key = attr_name
+        self._value_getter = attrgetter(attr_name)
 
     @property
     def is_on(self) -> bool | None:
         """Return true if there is a problem (value is not 'reset' and not None)."""
-        channel = self._device.channels.get(DEFAULT_CHANNEL)
+        channel = self._channel
         if not channel:
             return None
-        value = getattr(channel, self._attr_name_key, None)
+        value = self._value_getter(channel)
         if value is None:
             return None
         # "reset" means the error/warning has been cleared
@@ -257,7 +267,7 @@ class OpusGreenNetBatterySensor(OpusGreenNetBaseBinarySensor):
 
         Note: BinarySensorDeviceClass.BATTERY is_on=True means low battery.
         """
-        channel = self._device.channels.get(DEFAULT_CHANNEL)
+        channel = self._channel
         if not channel:
             return None
         value = channel.actuator_low_battery
@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import logging
+from operator import attrgetter
 from typing import Any
 
 from homeassistant.components.climate import (
@@ -17,16 +18,49 @@ from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-from .const import CONF_EAG_ID, DEFAULT_CHANNEL, DOMAIN
-from .coordinator import (
-    SIGNAL_DEVICE_DISCOVERED,
-    SIGNAL_DEVICE_STATE_UPDATE,
-    OpusGreenNetCoordinator,
+from .const import (
+    CONF_EAG_ID,
+    DEFAULT_CHANNEL,
+    DOMAIN,
+    HeaterMode,
 )
+from .coordinator import OpusGreenNetCoordinator
 from .enocean_device import EnOceanDevice
 
 _LOGGER = logging.getLogger(__name__)
 
+# Channel fields exposed as extra state attributes when set
+_STATE_ATTRS = (
+    "window_open",
+    "summer_mode",
+    "feed_temperature",
+    "thermal_mode",
+    "energy_consumption",
+    "power_state",
+    "temperature_origin",
+    "heater_mode",
+)
+
+# Error/warning channel fields, exposed only while active (not "reset")
+_ERROR_ATTRS = (
+    "actuator_deactivated",
+    "actuator_low_battery",
+    "actuator_not_responding",
+    "missing_temperature",
+    "circuit_in_use",
+)
+
+# Channel fields that make up the entity state, used to skip no-op writes
+_observed_values = attrgetter(
+    "temperature", "temperature_setpoint", "humidity", *_STATE_ATTRS, *_ERROR_ATTRS
+)
+
+# heaterMode values grouped by the HVAC state they represent
+_ACTIVE_HEAT_MODES = frozenset({HeaterMode.HEATING, HeaterMode.ON})
+_OFF_MODES = frozenset(
+    {HeaterMode.OFF, HeaterMode.CONFIG_INCOMPLETE, HeaterMode.ERROR}
+)
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -37,11 +71,10 @@ async def async_setup_entry(
     coordinator: OpusGreenNetCoordinator = hass.data[DOMAIN][entry.entry_id]
     eag_id = entry.data[CONF_EAG_ID]
 
-    @callback
-    def async_add_climate(device: EnOceanDevice) -> None:
-        """Add a climate entity for a discovered device."""
+    def build_entities(device: EnOceanDevice) -> list[OpusGreenNetClimate]:
+        """Build the climate entity for a device."""
         if device.entity_type != "climate":
-            return
+            return []
 
         _LOGGER.debug(
             "Adding climate entity for device: %s (%s)",
@@ -49,33 +82,43 @@ async def async_setup_entry(
             device.device_id,
         )
 
-        entities = [
+        return [
             OpusGreenNetClimate(
                 coordinator=coordinator,
                 eag_id=eag_id,
                 device=device,
             )
         ]
-        async_add_entities(entities)
 
-    # Listen for new device discoveries
+    @callback
+    def async_add_climate(device: EnOceanDevice) -> None:
+        """Add a climate entity for a discovered device."""
+        if entities := build_entities(device):
+            async_add_entities(entities)
+
+    # Listen for new climate device discoveries
     entry.async_on_unload(
         async_dispatcher_connect(
             hass,
-            f"{SIGNAL_DEVICE_DISCOVERED}_{eag_id}",
+            coordinator.climate_discovery_signal,
             async_add_climate,
         )
     )
 
-    # Add entities for already discovered devices
-    for device in coordinator.devices.values():
-        async_add_climate(device)
+    # Add entities for already discovered devices in a single batch
+    if entities := [
+        entity
+        for device in coordinator.climate_devices
+        for entity in build_entities(device)
+    ]:
+        async_add_entities(entities)
 
 
 class OpusGreenNetClimate(ClimateEntity):
     """Representation of an Opus GreenNet HeatArea climate device."""
 
     _attr_has_entity_name = True
+    _attr_available = True
     _attr_temperature_unit = UnitOfTemperature.CELSIUS
     _attr_min_temp = 0
     _attr_max_temp = 40
@@ -93,48 +136,56 @@ class OpusGreenNetClimate(ClimateEntity):
         self._eag_id = eag_id
         self._device = device
         self._device_key = device.friendly_id or device.device_id
+        self._channel = device.get_channel(DEFAULT_CHANNEL)
 
         self._attr_unique_id = f"{eag_id}_{device.device_id}"
         self._attr_name = None  # Use device name
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, f"{eag_id}_{device.device_id}")},
+            name=self._device_key,
+            manufacturer=device.manufacturer or "OPUS / EnOcean",
+            model=device.primary_eep or "Unknown",
+            via_device=(DOMAIN, eag_id),
+        )
 
         # Set step based on heat area type
         self._attr_target_temperature_step = device.setpoint_step
 
         # Set HVAC modes based on EEP type
-        # D1-4B-06 (CosiTherm) supports thermalMode cooling/heating
-        if device.primary_eep == "D1-4B-06":
-            self._attr_hvac_modes = [HVACMode.HEAT_COOL, HVACMode.OFF]
-        else:
-            # D1-4B-05 (Valve) and D1-4B-07 (Electro) are heat-only
-            self._attr_hvac_modes = [HVACMode.HEAT, HVACMode.OFF]
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device info."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, f"{self._eag_id}_{self._device.device_id}")},
-            name=self._device.friendly_id or self._device.device_id,
-            manufacturer=self._device.manufacturer or "OPUS / EnOcean",
-            model=self._device.primary_eep or "Unknown",
-            via_device=(DOMAIN, self._eag_id),
+        # D1-4B-06 (CosiTherm) supports thermalMode cooling/heating,
+        # D1-4B-05 (Valve) and D1-4B-07 (Electro) are heat-only
+        self._is_cosi = device.primary_eep == "D1-4B-06"
+        # heaterMode value used to switch on: CosiTherm uses "on", others "heating"
+        self._mode_value_on = HeaterMode.ON if self._is_cosi else HeaterMode.HEATING
+        heat_mode = HVACMode.HEAT_COOL if self._is_cosi else HVACMode.HEAT
+        self._attr_hvac_modes = [heat_mode, HVACMode.OFF]
+
+        # heaterMode value -> HVAC mode/action, resolved once per entity
+        self._mode_map: dict[str, HVACMode] = dict.fromkeys(
+            _ACTIVE_HEAT_MODES, heat_mode
         )
+        self._action_map: dict[str, HVACAction] = {
+            **dict.fromkeys(_ACTIVE_HEAT_MODES, HVACAction.HEATING),
+            **dict.fromkeys(_OFF_MODES, HVACAction.OFF),
+            HeaterMode.AUTO_OFF: HVACAction.IDLE,  # Temporarily disabled (window/summer)
+        }
 
     @property
     def current_temperature(self) -> float | None:
         """Return the current temperature."""
-        channel = self._device.channels.get(DEFAULT_CHANNEL)
+        channel = self._channel
         return channel.temperature if channel else None
 
     @property
     def target_temperature(self) -> float | None:
         """Return the target temperature setpoint."""
-        channel = self._device.channels.get(DEFAULT_CHANNEL)
+        channel = self._channel
         return channel.temperature_setpoint if channel else None
 
     @property
     def current_humidity(self) -> int | None:
         """Return the current humidity."""
-        channel = self._device.channels.get(DEFAULT_CHANNEL)
+        channel = self._channel
         if channel and channel.humidity is not None:
             return int(channel.humidity)
         return None
@@ -142,83 +193,46 @@ class OpusGreenNetClimate(ClimateEntity):
     @property
     def hvac_mode(self) -> HVACMode:
         """Return the current HVAC mode."""
-        channel = self._device.channels.get(DEFAULT_CHANNEL)
-        if not channel or not channel.heater_mode:
+        channel = self._channel
+        if not channel:
             return HVACMode.OFF
-
-        mode = channel.heater_mode
-        if mode in ("heating", "on"):
-            if self._device.primary_eep == "D1-4B-06":
-                return HVACMode.HEAT_COOL
-            return HVACMode.HEAT
-        return HVACMode.OFF
+        return self._mode_map.get(channel.heater_mode, HVACMode.OFF)
 
     @property
     def hvac_action(self) -> HVACAction | None:
         """Return the current HVAC action."""
-        channel = self._device.channels.get(DEFAULT_CHANNEL)
-        if not channel or not channel.heater_mode:
+        channel = self._channel
+        if not channel:
             return None
 
-        mode = channel.heater_mode
-        if mode in ("heating", "on"):
-            # For CosiTherm, check thermalMode for cooling vs heating
-            if (
-                self._device.primary_eep == "D1-4B-06"
-                and channel.thermal_mode == "cooling"
-            ):
-                return HVACAction.COOLING
-            return HVACAction.HEATING
-        if mode == "autoOff":
-            return HVACAction.IDLE  # Temporarily disabled (window/summer)
-        if mode in ("off", "configIncomplete", "error"):
-            return HVACAction.OFF
-        return None
-
-    @property
-    def available(self) -> bool:
-        """Return if entity is available."""
-        return True
+        action = self._action_map.get(channel.heater_mode)
+        # For CosiTherm, check thermalMode for cooling vs heating
+        if (
+            action is HVACAction.HEATING
+            and self._is_cosi
+            and channel.thermal_mode == "cooling"
+        ):
+            return HVACAction.COOLING
+        return action
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return extra state attributes."""
-        channel = self._device.channels.get(DEFAULT_CHANNEL)
+        channel = self._channel
         attrs: dict[str, Any] = {}
         if not channel:
             return attrs
 
-        if channel.window_open is not None:
-            attrs["window_open"] = channel.window_open
-        if channel.summer_mode is not None:
-            attrs["summer_mode"] = channel.summer_mode
-        if channel.feed_temperature is not None:
-            attrs["feed_temperature"] = channel.feed_temperature
-        if channel.thermal_mode is not None:
-            attrs["thermal_mode"] = channel.thermal_mode
-        if channel.energy_consumption is not None:
-            attrs["energy_consumption"] = channel.energy_consumption
-        if channel.power_state is not None:
-            attrs["power_state"] = channel.power_state
-        if channel.temperature_origin is not None:
-            attrs["temperature_origin"] = channel.temperature_origin
-        if channel.heater_mode is not None:
-            attrs["heater_mode"] = channel.heater_mode
+        for attr in _STATE_ATTRS:
+            value = getattr(channel, attr)
+            if value is not None:
+                attrs[attr] = value
 
         # Error states (only show active errors, not "reset")
-        if channel.actuator_deactivated and channel.actuator_deactivated != "reset":
-            attrs["actuator_deactivated"] = channel.actuator_deactivated
-        if channel.actuator_low_battery and channel.actuator_low_battery != "reset":
-            attrs["actuator_low_battery"] = channel.actuator_low_battery
-        if (
-            channel.actuator_not_responding
-            and channel.actuator_not_responding != "reset"
-        ):
-            attrs["actuator_not_responding"] = channel.actuator_not_responding
-        if channel.missing_temperature and channel.missing_temperature != "reset":
-            attrs["missing_temperature"] = channel.missing_temperature
-        if channel.circuit_in_use and channel.circuit_in_use != "reset":
-            attrs["circuit_in_use"] = channel.circuit_in_use
+        for attr in _ERROR_ATTRS:
+            value = getattr(channel, attr)
+            if value and value != "reset":
+                attrs[attr] = value
 
         return attrs
 
@@ -237,22 +251,16 @@ class OpusGreenNetClimate(ClimateEntity):
                 self._device.device_id, "off"
             )
         elif hvac_mode in (HVACMode.HEAT, HVACMode.HEAT_COOL):
-            # D1-4B-06 (CosiTherm) uses "on", others use "heating"
-            if self._device.primary_eep == "D1-4B-06":
-                mode_value = "on"
-            else:
-                mode_value = "heating"
             await self._coordinator.async_set_climate_mode(
-                self._device.device_id, mode_value
+                self._device.device_id, self._mode_value_on
             )
 
     async def async_added_to_hass(self) -> None:
         """Register callbacks when entity is added."""
+        self._last_signature = self._state_signature()
         self.async_on_remove(
-            async_dispatcher_connect(
-                self.hass,
-                f"{SIGNAL_DEVICE_STATE_UPDATE}_{self._eag_id}_{self._device_key}",
-                self._handle_state_update,
+            self._coordinator.register_listener(
+                self._device_key, self._handle_state_update
             )
         )
 
@@ -260,4 +268,16 @@ class OpusGreenNetClimate(ClimateEntity):
     def _handle_state_update(self, device: EnOceanDevice) -> None:
         """Handle state update from coordinator."""
         self._device = device
+        self._channel = device.get_channel(DEFAULT_CHANNEL)
+
+        # Re-announcements often carry no change; skip the state write then
+        signature = self._state_signature()
+        if signature == self._last_signature:
+            return
+        self._last_signature = signature
         self.async_write_ha_state()
+
+    def _state_signature(self) -> tuple[Any, ...] | None:
+        """Return the channel values the entity state is derived from."""
+        channel = self._channel
+        return _observed_values(channel) if channel else None
@@ -2,7 +2,6 @@
 from __future__ import annotations
 
 import logging
-import re
 from typing import Any
 
 import voluptuous as vol
@@ -16,8 +15,8 @@ from .const import CONF_EAG_ID, DOMAIN
 
 _LOGGER = logging.getLogger(__name__)
 
-# Regex pattern for EAG ID (8 hex characters)
-EAG_ID_PATTERN = re.compile(r"^[0-9A-Fa-f]{8}$")
+# EAG ID length (4 bytes as 8 hex characters)
+EAG_ID_BYTES = 4
 
 STEP_USER_DATA_SCHEMA = vol.Schema(
     {
@@ -31,11 +30,19 @@ async def validate_input(hass: HomeAssistant, data: dict[str, Any]) -> dict[str,
 
     Data has the keys from STEP_USER_DATA_SCHEMA with values provided by the user.
     """
-    eag_id = data[CONF_EAG_ID].upper()
+    eag_id = data[CONF_EAG_ID]
 
-    # Validate EAG ID format
-    if not EAG_ID_PATTERN.match(eag_id):
+    # Validate EAG ID format; fromhex skips spaces, so check the length as well
+    try:
+        valid = (
+            len(eag_id) == 2 * EAG_ID_BYTES
+            and len(bytes.fromhex(eag_id)) == EAG_ID_BYTES
+        )
+    except ValueError:
+        valid = False
+    if not valid:
         raise InvalidEagId
+    eag_id = eag_id.upper()
 
     # Check if MQTT is available
     if not mqtt.is_connected(hass):
@@ -1,6 +1,9 @@
 """Constants for the Opus GreenNet Bridge integration."""
 from __future__ import annotations
 
+import sys
+from dataclasses import dataclass, field
+from enum import StrEnum
 from typing import Final
 
 DOMAIN: Final = "opus_greennet"
@@ -67,6 +70,90 @@ TOPIC_SUB_DEVICES: Final = "{base}/{eag_id}/stream/devices/+"
 TOPIC_SUB_DEVICES_ALL: Final = "{base}/{eag_id}/stream/devices/#"
 TOPIC_SUB_GET_ANSWER: Final = "{base}/{eag_id}/getAnswer/devices/+"
 
+# Stream kinds in {base}/{eag_id}/stream/{kind}/{device_id}/{property}
+STREAM_DEVICES: Final = "devices"  # Initial full state at boot
+STREAM_DEVICE: Final = "device"  # Live device model deltas
+STREAM_TELEGRAM: Final = "telegram"  # Raw radio traffic
+
+
+def parse_stream_topic(topic: str) -> tuple[str, str, str, str] | None:
+    """Split a stream topic into (kind, eag_id, device_id, property_path).
+
+    Returns None if the topic is not a {base}/{eag_id}/stream/... topic with
+    a device ID and a property path. The device ID is interned, as it is
+    used as a key into the coordinator's per-device dicts.
+    """
+    parts = topic.split("/", 5)
+    if (
+        len(parts) != 6
+        or parts[0] != TOPIC_BASE
+        or parts[2] != "stream"
+        or not parts[1]
+        or not parts[4]
+        or not parts[5]
+    ):
+        return None
+    return parts[3], parts[1], sys.intern(parts[4]), parts[5]
+
+
+@dataclass(frozen=True, slots=True)
+class TopicBuilder:
+    """Build the MQTT topics of one gateway.
+
+    Mirrors the TOPIC_* patterns above, but joins them onto a prefix that is
+    computed once per gateway instead of formatting a template per call.
+    """
+
+    base: str
+    eag_id: str
+    _prefix: str = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "_prefix", f"{self.base}/{self.eag_id}")
+
+    # Subscriptions
+    def sub_telegram_all(self) -> str:
+        return f"{self._prefix}/stream/telegram/#"
+
+    def sub_device_stream_all(self) -> str:
+        return f"{self._prefix}/stream/device/#"
+
+    def sub_devices_all(self) -> str:
+        return f"{self._prefix}/stream/devices/#"
+
+    def get_answer_devices(self) -> str:
+        return f"{self._prefix}/getAnswer/devices/#"
+
+    # Gateway requests
+    def get_devices(self) -> str:
+        return f"{self._prefix}/get/devices"
+
+    def get_system_info(self) -> str:
+        return f"{self._prefix}/get/config/system/info"
+
+    def get_answer_system_info(self) -> str:
+        return f"{self._prefix}/getAnswer/config/system/info"
+
+    def get_system_uptime(self) -> str:
+        return f"{self._prefix}/get/config/system/uptime"
+
+    def get_answer_system_uptime(self) -> str:
+        return f"{self._prefix}/getAnswer/config/system/uptime"
+
+    # Per-device topics
+    def put_state(self, device_id: str) -> str:
+        return f"{self._prefix}/put/devices/{device_id}/state"
+
+    def get_device(self, device_id: str, resource: str) -> str:
+        return f"{self._prefix}/get/devices/{device_id}/{resource}"
+
+    def get_answer_device(self, device_id: str, resource: str) -> str:
+        return f"{self._prefix}/getAnswer/devices/{device_id}/{resource}"
+
+    def put_device(self, device_id: str, resource: str) -> str:
+        return f"{self._prefix}/put/devices/{device_id}/{resource}"
+
+
 # EEP (EnOcean Equipment Profile) to entity type mappings
 # Format: EEP prefix -> (entity_type, description)
 EEP_MAPPINGS: Final = {
@@ -110,6 +197,26 @@ EEP_MAPPINGS: Final = {
     "F6-03-02": ("event", "Rocker Switch, 4 Rocker"),
 }
 
+# EEPs supporting dimming
+DIMMABLE_EEPS: Final = frozenset({
+    "D2-01-02",
+    "D2-01-03",
+    "D2-01-06",
+    "D2-01-07",
+    "D2-01-0A",
+    "D2-01-0B",
+    "D2-01-0F",
+    "D2-01-10",
+    "D2-01-12",
+    "A5-38-08",
+})
+
+# Blinds EEPs supporting tilt/angle control
+TILT_EEPS: Final = frozenset({"D2-05-00", "D2-05-02"})
+
+# HeatArea EEPs
+CLIMATE_EEPS: Final = frozenset({"D1-4B-05", "D1-4B-06", "D1-4B-07"})
+
 # Entity type to platform mapping
 ENTITY_PLATFORMS: Final = {
     "light": "light",
@@ -172,6 +279,9 @@ BUTTON_KEYS: Final = (
 BUTTON_VALUE_PRESSED: Final = "pressed"
 BUTTON_VALUE_RELEASED: Final = "released"
 
+# Value reported for a function the device has not transmitted yet
+VALUE_NOT_AVAILABLE: Final = "notAvailable"
+
 # Switch/Light states
 STATE_ON: Final = "on"
 STATE_OFF: Final = "off"
@@ -181,41 +291,19 @@ COVER_OPEN: Final = "open"
 COVER_CLOSED: Final = "closed"
 COVER_STOP: Final = "stop"
 
-# Climate heater mode values
-HEATER_MODE_HEATING: Final = "heating"
-HEATER_MODE_ON: Final = "on"
-HEATER_MODE_OFF: Final = "off"
-HEATER_MODE_AUTO_OFF: Final = "autoOff"
-HEATER_MODE_CONFIG_INCOMPLETE: Final = "configIncomplete"
-HEATER_MODE_ERROR: Final = "error"
+
+class HeaterMode(StrEnum):
+    """Climate heaterMode values."""
+
+    HEATING = "heating"
+    ON = "on"
+    OFF = "off"
+    AUTO_OFF = "autoOff"
+    CONFIG_INCOMPLETE = "configIncomplete"
+    ERROR = "error"
+
 
 # Default values
 DEFAULT_CHANNEL: Final = 0
-
-# All known state keys for initial state application
-KNOWN_STATE_KEYS: Final = frozenset({
-    "switch",
-    "dimValue",
-    "position",
-    "angle",
-    "localControl",
-    "energy",
-    "power",
-    "temperature",
-    "temperatureSetpoint",
-    "heaterMode",
-    "humidity",
-    "windowOpen",
-    "summerMode",
-    "feedTemperature",
-    "thermalMode",
-    "energyConsumption",
-    "powerState",
-    "temperatureOrigin",
-    "actuatorDeactivated",
-    "actuatorLowBattery",
-    "actuatorNotResponding",
-    "missingTemperature",
-    "circuitInUse",
-    *BUTTON_KEYS,
-})
+# Upper bound for telegram channel IDs; the EnOcean channel field has 5 bits
+MAX_CHANNELS: Final = 32
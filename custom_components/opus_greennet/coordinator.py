@@ -3,7 +3,7 @@ from __future__ import annotations
 
 import json
 import logging
-import re
+import sys
 from collections.abc import Callable
 from typing import Any
 
@@ -12,53 +12,95 @@ from homeassistant.components.mqtt import ReceiveMessage
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.dispatcher import async_dispatcher_send
 from homeassistant.helpers.event import async_call_later
+from homeassistant.helpers.json import json_dumps
+from homeassistant.util.json import json_loads
 
 from .const import (
     DOMAIN,
-    KNOWN_STATE_KEYS,
+    STREAM_DEVICE,
+    STREAM_DEVICES,
+    STREAM_TELEGRAM,
     TOPIC_BASE,
-    TOPIC_GET_ANSWER_DEVICES,
-    TOPIC_GET_ANSWER_DEVICE_CONFIGURATION,
-    TOPIC_GET_ANSWER_DEVICE_PROFILE,
-    TOPIC_GET_ANSWER_SYSTEM_INFO,
-    TOPIC_GET_ANSWER_SYSTEM_UPTIME,
-    TOPIC_GET_DEVICES,
-    TOPIC_GET_DEVICE_CONFIGURATION,
-    TOPIC_GET_DEVICE_PARAMETERS,
-    TOPIC_GET_DEVICE_PROFILE,
-    TOPIC_GET_SYSTEM_INFO,
-    TOPIC_GET_SYSTEM_UPTIME,
-    TOPIC_PUT_DEVICE_CONFIGURATION,
-    TOPIC_PUT_STATE,
-    TOPIC_SUB_DEVICE_STREAM_ALL,
-    TOPIC_SUB_DEVICES_ALL,
-    TOPIC_SUB_TELEGRAM_FROM_ALL,
+    TopicBuilder,
+    parse_stream_topic,
 )
-from .enocean_device import EnOceanDevice
+from .enocean_device import KNOWN_STATE_KEYS, EnOceanDevice
 
 _LOGGER = logging.getLogger(__name__)
 
 # Dispatcher signals
 SIGNAL_DEVICE_DISCOVERED = f"{DOMAIN}_device_discovered"
 SIGNAL_DEVICE_STATE_UPDATE = f"{DOMAIN}_device_state_update"
-
-# Regex to parse device topics (plural - initial full state at boot)
-# EnOcean/{EAG}/stream/devices/{DeviceID}/{property}
-DEVICE_TOPIC_PATTERN = re.compile(
-    r"EnOcean/([^/]+)/stream/devices/([^/]+)/(.+)"
-)
-
-# Regex to parse telegram topics
-# EnOcean/{EAG}/stream/telegram/{DeviceID}/{property}
-TELEGRAM_TOPIC_PATTERN = re.compile(
-    r"EnOcean/([^/]+)/stream/telegram/([^/]+)/(.+)"
-)
-
-# Regex to parse device stream topics (singular - live deltas)
-# EnOcean/{EAG}/stream/device/{DeviceID}/{property}
-DEVICE_STREAM_TOPIC_PATTERN = re.compile(
-    r"EnOcean/([^/]+)/stream/device/([^/]+)/(.+)"
-)
+SIGNAL_CLIMATE_DEVICE_DISCOVERED = f"{DOMAIN}_climate_device_discovered"
+
+# Fixed envelope of a state command; only the functions array varies
+_STATE_PAYLOAD_PREFIX = '{"state":{"functions":'
+_STATE_PAYLOAD_SUFFIX = "}}"
+
+
+# Fixed key vocabulary of the flattened topics and the function keys that
+# arrive as values; mapped to one shared string each. Free-form strings
+# (names, serials, timestamps) are left alone.
+_CANONICAL_STRINGS: dict[str, str] = {
+    key: sys.intern(key)
+    for key in (
+        *KNOWN_STATE_KEYS,
+        "channel",
+        "deviceId",
+        "friendlyId",
+        "eeps",
+        "eep",
+        "manufacturer",
+        "physicalDevice",
+        "firstSeen",
+        "lastSeen",
+        "dbm",
+        "state",
+        "states",
+        "functions",
+        "key",
+        "value",
+        "from",
+        "to",
+        "direction",
+        "timestamp",
+        "telegramInfo",
+    )
+}
+
+
+def _parse_value(value: str) -> Any:
+    """Parse a string value to appropriate type."""
+    if value.lower() == "true":
+        return True
+    if value.lower() == "false":
+        return False
+    try:
+        return int(value)
+    except ValueError:
+        pass
+    try:
+        return float(value)
+    except ValueError:
+        pass
+    # Function keys are looked up in the telegram handler table
+    return _CANONICAL_STRINGS.get(value, value)
+
+
+def _as_list(data: Any) -> list[Any]:
+    """Return the entries of an array in index order.
+
+    Arrays arrive as lists, or as dicts keyed by index when they were
+    rebuilt from flattened MQTT topics. Anything else yields no entries.
+    """
+    if isinstance(data, list):
+        return data
+    if isinstance(data, dict):
+        return [
+            data[idx]
+            for idx in sorted(data, key=lambda x: int(x) if str(x).isdigit() else x)
+        ]
+    return []
 
 
 class OpusGreenNetCoordinator:
@@ -68,11 +110,22 @@ class OpusGreenNetCoordinator:
         """Initialize the coordinator."""
         self.hass = hass
         self.eag_id = eag_id
+        self.topics = TopicBuilder(TOPIC_BASE, eag_id)
         self.devices: dict[str, EnOceanDevice] = {}
+        # Devices partitioned by entity type, keyed by device key
+        self.devices_by_kind: dict[str, dict[str, EnOceanDevice]] = {}
         self._device_data: dict[str, dict[str, Any]] = {}  # Raw device properties
         self._telegram_data: dict[str, dict[str, Any]] = {}  # Raw telegram properties
         self._device_stream_data: dict[str, dict[str, Any]] = {}  # Device stream deltas
         self._subscriptions: list[Callable[[], None]] = []
+        # Direct per-device state listeners, keyed by device key
+        self._state_listeners: dict[str, list[Callable[[EnOceanDevice], None]]] = {}
+        # Precomputed dispatcher signal names
+        self.discovery_signal = sys.intern(f"{SIGNAL_DEVICE_DISCOVERED}_{eag_id}")
+        self.climate_discovery_signal = sys.intern(
+            f"{SIGNAL_CLIMATE_DEVICE_DISCOVERED}_{eag_id}"
+        )
+        self._state_signal_for: dict[str, str] = {}
         self._discovery_complete = False
         self._pending_devices: set[str] = set()
         self._pending_telegrams: dict[str, Callable | None] = {}  # Timers per device
@@ -87,9 +140,7 @@ class OpusGreenNetCoordinator:
         _LOGGER.debug("Setting up Opus GreenNet coordinator for EAG %s", self.eag_id)
 
         # Subscribe to telegram stream with # wildcard (flattened structure)
-        topic_telegram = TOPIC_SUB_TELEGRAM_FROM_ALL.format(
-            base=TOPIC_BASE, eag_id=self.eag_id
-        )
+        topic_telegram = self.topics.sub_telegram_all()
         self._subscriptions.append(
             await mqtt.async_subscribe(
                 self.hass, topic_telegram, self._handle_telegram_property_message, qos=1
@@ -98,9 +149,7 @@ class OpusGreenNetCoordinator:
         _LOGGER.info("Subscribed to telegram topic: %s", topic_telegram)
 
         # Subscribe to ALL device properties with # wildcard (initial full state)
-        topic_devices_all = TOPIC_SUB_DEVICES_ALL.format(
-            base=TOPIC_BASE, eag_id=self.eag_id
-        )
+        topic_devices_all = self.topics.sub_devices_all()
         self._subscriptions.append(
             await mqtt.async_subscribe(
                 self.hass, topic_devices_all, self._handle_device_property_message, qos=1
@@ -109,9 +158,7 @@ class OpusGreenNetCoordinator:
         _LOGGER.info("Subscribed to devices topic: %s", topic_devices_all)
 
         # Subscribe to device stream (singular) for live delta updates
-        topic_device_stream = TOPIC_SUB_DEVICE_STREAM_ALL.format(
-            base=TOPIC_BASE, eag_id=self.eag_id
-        )
+        topic_device_stream = self.topics.sub_device_stream_all()
         self._subscriptions.append(
             await mqtt.async_subscribe(
                 self.hass,
@@ -123,9 +170,7 @@ class OpusGreenNetCoordinator:
         _LOGGER.info("Subscribed to device stream topic: %s", topic_device_stream)
 
         # Subscribe to getAnswer/devices for active discovery
-        topic_get_answer = TOPIC_GET_ANSWER_DEVICES.format(
-            base=TOPIC_BASE, eag_id=self.eag_id
-        )
+        topic_get_answer = self.topics.get_answer_devices()
         self._subscriptions.append(
             await mqtt.async_subscribe(
                 self.hass,
@@ -137,9 +182,7 @@ class OpusGreenNetCoordinator:
         _LOGGER.info("Subscribed to getAnswer topic: %s", topic_get_answer)
 
         # Subscribe to gateway system info answers
-        topic_system_info = TOPIC_GET_ANSWER_SYSTEM_INFO.format(
-            base=TOPIC_BASE, eag_id=self.eag_id
-        )
+        topic_system_info = self.topics.get_answer_system_info()
         self._subscriptions.append(
             await mqtt.async_subscribe(
                 self.hass,
@@ -149,9 +192,7 @@ class OpusGreenNetCoordinator:
             )
         )
 
-        topic_system_uptime = TOPIC_GET_ANSWER_SYSTEM_UPTIME.format(
-            base=TOPIC_BASE, eag_id=self.eag_id
-        )
+        topic_system_uptime = self.topics.get_answer_system_uptime()
         self._subscriptions.append(
             await mqtt.async_subscribe(
                 self.hass,
@@ -162,9 +203,7 @@ class OpusGreenNetCoordinator:
         )
 
         # Request device list via GET (active discovery)
-        topic_get = TOPIC_GET_DEVICES.format(
-            base=TOPIC_BASE, eag_id=self.eag_id
-        )
+        topic_get = self.topics.get_devices()
         await mqtt.async_publish(self.hass, topic_get, "", qos=1)
         _LOGGER.info("Requested device list via GET: %s", topic_get)
 
@@ -195,13 +234,13 @@ class OpusGreenNetCoordinator:
     def _handle_device_property_message(self, msg: ReceiveMessage) -> None:
         """Handle incoming device property messages from flattened MQTT structure."""
         try:
-            match = DEVICE_TOPIC_PATTERN.match(msg.topic)
-            if not match:
+            parsed = parse_stream_topic(msg.topic)
+            if parsed is None:
                 return
 
-            eag_id, device_id, property_path = match.groups()
+            kind, eag_id, device_id, property_path = parsed
 
-            if eag_id != self.eag_id:
+            if kind != STREAM_DEVICES or eag_id != self.eag_id:
                 return
 
             if device_id not in self._device_data:
@@ -229,13 +268,13 @@ class OpusGreenNetCoordinator:
     def _handle_device_stream_message(self, msg: ReceiveMessage) -> None:
         """Handle live device model delta messages from stream/device/{EURID}."""
         try:
-            match = DEVICE_STREAM_TOPIC_PATTERN.match(msg.topic)
-            if not match:
+            parsed = parse_stream_topic(msg.topic)
+            if parsed is None:
                 return
 
-            eag_id, device_id, property_path = match.groups()
+            kind, eag_id, device_id, property_path = parsed
 
-            if eag_id != self.eag_id:
+            if kind != STREAM_DEVICE or eag_id != self.eag_id:
                 return
 
             if device_id not in self._device_stream_data:
@@ -301,14 +340,9 @@ class OpusGreenNetCoordinator:
         # Format 1: state.functions array (from stream/device deltas)
         state_obj = stream_data.get("state", {})
         if isinstance(state_obj, dict):
-            functions_data = state_obj.get("functions", [])
-            if isinstance(functions_data, list):
-                functions = [f for f in functions_data if isinstance(f, dict)]
-            elif isinstance(functions_data, dict):
-                for idx in sorted(functions_data.keys(), key=lambda x: int(x) if str(x).isdigit() else x):
-                    func_entry = functions_data[idx]
-                    if isinstance(func_entry, dict):
-                        functions.append(func_entry)
+            functions = [
+                f for f in _as_list(state_obj.get("functions")) if isinstance(f, dict)
+            ]
 
         # Format 2: states flat dict (from stream/devices boot data, if routed here)
         if not functions:
@@ -322,8 +356,7 @@ class OpusGreenNetCoordinator:
             telegram = {"functions": functions}
             device.update_from_telegram(telegram)
 
-            signal = f"{SIGNAL_DEVICE_STATE_UPDATE}_{self.eag_id}_{device_key}"
-            async_dispatcher_send(self.hass, signal, device)
+            self._notify_state_update(device_key, device)
 
     # ──────────────────────────────────────────────────────────────────────
     # GET answer handler (active discovery)
@@ -333,11 +366,7 @@ class OpusGreenNetCoordinator:
     def _handle_get_answer_devices(self, msg: ReceiveMessage) -> None:
         """Handle getAnswer/devices response with device data."""
         try:
-            payload = msg.payload
-            if isinstance(payload, bytes):
-                payload = payload.decode()
-
-            data = json.loads(payload)
+            data = json_loads(msg.payload)
 
             # Response may be a list of devices or a single device object
             if isinstance(data, list):
@@ -378,10 +407,7 @@ class OpusGreenNetCoordinator:
     def _handle_system_info(self, msg: ReceiveMessage) -> None:
         """Handle gateway system info response."""
         try:
-            payload = msg.payload
-            if isinstance(payload, bytes):
-                payload = payload.decode()
-            data = json.loads(payload)
+            data = json_loads(msg.payload)
             self.gateway_info = data
             _LOGGER.info("Gateway info: %s", data)
         except (json.JSONDecodeError, Exception) as err:
@@ -401,12 +427,8 @@ class OpusGreenNetCoordinator:
 
     async def _request_gateway_info(self) -> None:
         """Request gateway system info and uptime."""
-        topic_info = TOPIC_GET_SYSTEM_INFO.format(
-            base=TOPIC_BASE, eag_id=self.eag_id
-        )
-        topic_uptime = TOPIC_GET_SYSTEM_UPTIME.format(
-            base=TOPIC_BASE, eag_id=self.eag_id
-        )
+        topic_info = self.topics.get_system_info()
+        topic_uptime = self.topics.get_system_uptime()
         await mqtt.async_publish(self.hass, topic_info, "", qos=1)
         await mqtt.async_publish(self.hass, topic_uptime, "", qos=1)
 
@@ -416,7 +438,8 @@ class OpusGreenNetCoordinator:
 
     def _set_nested_property(self, data: dict, path: str, value: str) -> None:
         """Set a nested property in a dict using a path like 'eeps/0/eep'."""
-        parts = path.split("/")
+        # Known keys share one string across all accumulated messages
+        parts = [_CANONICAL_STRINGS.get(part, part) for part in path.split("/")]
         current = data
 
         for i, part in enumerate(parts[:-1]):
@@ -442,25 +465,13 @@ class OpusGreenNetCoordinator:
             idx = int(final_key)
             while len(current) <= idx:
                 current.append(None)
-            current[idx] = self._parse_value(value)
+            current[idx] = _parse_value(value)
         else:
-            current[final_key] = self._parse_value(value)
+            current[final_key] = _parse_value(value)
 
     def _parse_value(self, value: str) -> Any:
         """Parse a string value to appropriate type."""
-        if value.lower() == "true":
-            return True
-        if value.lower() == "false":
-            return False
-        try:
-            return int(value)
-        except ValueError:
-            pass
-        try:
-            return float(value)
-        except ValueError:
-            pass
-        return value
+        return _parse_value(value)
 
     # ──────────────────────────────────────────────────────────────────────
     # Device discovery finalization
@@ -485,17 +496,16 @@ class OpusGreenNetCoordinator:
             device_key = friendly_id
 
             # Build EEPs list
-            eeps = []
-            eeps_data = data.get("eeps", {})
-            if isinstance(eeps_data, list):
-                eeps = eeps_data
-            elif isinstance(eeps_data, dict):
-                for idx in sorted(eeps_data.keys(), key=lambda x: int(x) if x.isdigit() else x):
-                    eep_entry = eeps_data[idx]
-                    if isinstance(eep_entry, dict):
-                        eeps.append(eep_entry)
-                    elif isinstance(eep_entry, str):
-                        eeps.append({"eep": eep_entry})
+            eeps = [
+                {"eep": eep_entry} if isinstance(eep_entry, str) else eep_entry
+                for eep_entry in _as_list(data.get("eeps"))
+                if isinstance(eep_entry, (dict, str))
+            ]
+
+            # Intern EEP codes: a small fixed set shared by many devices
+            for eep_entry in eeps:
+                if isinstance(eep_entry, dict) and isinstance(eep_entry.get("eep"), str):
+                    eep_entry["eep"] = sys.intern(eep_entry["eep"])
 
             is_new = device_key not in self.devices
             was_incomplete = (
@@ -510,7 +520,7 @@ class OpusGreenNetCoordinator:
                 physical_device=data.get("physicalDevice", ""),
                 first_seen=str(data.get("firstSeen", "")),
                 last_seen=str(data.get("lastSeen", "")),
-                dbm=data.get("dbm", 0),
+                dbm=data.get("dbm"),
             )
 
             # Preserve existing channel state or apply initial state from discovery
@@ -519,7 +529,7 @@ class OpusGreenNetCoordinator:
             else:
                 self._apply_initial_state(device, data)
 
-            self.devices[device_key] = device
+            self._store_device(device_key, device)
 
             _LOGGER.info(
                 "Device %s: %s (%s) - EEPs: %s - Type: %s",
@@ -532,15 +542,32 @@ class OpusGreenNetCoordinator:
 
             # Send discovery signal for new devices or devices that were incomplete
             if is_new or was_incomplete:
-                async_dispatcher_send(
-                    self.hass,
-                    f"{SIGNAL_DEVICE_DISCOVERED}_{self.eag_id}",
-                    device,
-                )
+                self._send_device_discovered(device)
 
         except Exception as err:
             _LOGGER.exception("Error creating device from data: %s", err)
 
+    @callback
+    def _send_device_discovered(self, device: EnOceanDevice) -> None:
+        """Announce a discovered device to the entity platforms.
+
+        Climate devices are additionally announced on their own signal so the
+        climate and binary sensor platforms only hear about devices they handle.
+        """
+        async_dispatcher_send(self.hass, self.discovery_signal, device)
+        if device.is_climate:
+            async_dispatcher_send(self.hass, self.climate_discovery_signal, device)
+
+    def _store_device(self, device_key: str, device: EnOceanDevice) -> None:
+        """Store a device and keep the per-entity-type index in sync."""
+        previous = self.devices.get(device_key)
+        if previous is not None and previous.entity_type:
+            self.devices_by_kind.get(previous.entity_type, {}).pop(device_key, None)
+
+        self.devices[device_key] = device
+        if device.entity_type:
+            self.devices_by_kind.setdefault(device.entity_type, {})[device_key] = device
+
     def _apply_initial_state(self, device: EnOceanDevice, data: dict) -> None:
         """Apply initial state from device discovery data."""
         _LOGGER.debug("INITIAL STATE: device=%s data_keys=%s", device.friendly_id, list(data.keys()))
@@ -572,13 +599,13 @@ class OpusGreenNetCoordinator:
     def _handle_telegram_property_message(self, msg: ReceiveMessage) -> None:
         """Handle incoming telegram property messages from flattened MQTT structure."""
         try:
-            match = TELEGRAM_TOPIC_PATTERN.match(msg.topic)
-            if not match:
+            parsed = parse_stream_topic(msg.topic)
+            if parsed is None:
                 return
 
-            eag_id, device_id, property_path = match.groups()
+            kind, eag_id, device_id, property_path = parsed
 
-            if eag_id != self.eag_id:
+            if kind != STREAM_TELEGRAM or eag_id != self.eag_id:
                 return
 
             if device_id not in self._telegram_data:
@@ -640,16 +667,9 @@ class OpusGreenNetCoordinator:
         )
 
         # Build functions list from the telegram data
-        functions = []
-        functions_data = effective_data.get("functions", [])
-
-        if isinstance(functions_data, list):
-            functions = [f for f in functions_data if isinstance(f, dict)]
-        elif isinstance(functions_data, dict):
-            for idx in sorted(functions_data.keys(), key=lambda x: int(x) if str(x).isdigit() else x):
-                func_entry = functions_data[idx]
-                if isinstance(func_entry, dict):
-                    functions.append(func_entry)
+        functions = [
+            f for f in _as_list(effective_data.get("functions")) if isinstance(f, dict)
+        ]
 
         # Create telegram dict in the format expected by update_from_telegram
         telegram = {
@@ -676,16 +696,12 @@ class OpusGreenNetCoordinator:
                 device_id=device_id,
                 friendly_id=friendly_id,
             )
-            self.devices[device_key] = device
+            self._store_device(device_key, device)
             _LOGGER.info(
                 "Auto-discovered device from telegram: %s",
                 device_id,
             )
-            async_dispatcher_send(
-                self.hass,
-                f"{SIGNAL_DEVICE_DISCOVERED}_{self.eag_id}",
-                device,
-            )
+            self._send_device_discovered(device)
 
         # Update device state
         if functions:
@@ -696,8 +712,58 @@ class OpusGreenNetCoordinator:
         device.update_from_telegram(telegram)
 
         # Notify listeners of state update
-        signal = f"{SIGNAL_DEVICE_STATE_UPDATE}_{self.eag_id}_{device_key}"
-        async_dispatcher_send(self.hass, signal, device)
+        self._notify_state_update(device_key, device)
+
+    # ──────────────────────────────────────────────────────────────────────
+    # State update listeners
+    # ──────────────────────────────────────────────────────────────────────
+
+    @callback
+    def register_listener(
+        self, device_key: str, update_callback: Callable[[EnOceanDevice], None]
+    ) -> Callable[[], None]:
+        """Register a direct state update callback for a device.
+
+        Returns a callable that removes the listener again.
+        """
+        self._state_listeners.setdefault(device_key, []).append(update_callback)
+
+        @callback
+        def remove_listener() -> None:
+            self.unregister_listener(device_key, update_callback)
+
+        return remove_listener
+
+    @callback
+    def unregister_listener(
+        self, device_key: str, update_callback: Callable[[EnOceanDevice], None]
+    ) -> None:
+        """Remove a state update callback registered with register_listener."""
+        listeners = self._state_listeners.get(device_key)
+        if not listeners or update_callback not in listeners:
+            return
+        listeners.remove(update_callback)
+        if not listeners:
+            del self._state_listeners[device_key]
+
+    def state_signal(self, device_key: str) -> str:
+        """Return the dispatcher signal for state updates of a device."""
+        signal = self._state_signal_for.get(device_key)
+        if signal is None:
+            signal = sys.intern(
+                f"{SIGNAL_DEVICE_STATE_UPDATE}_{self.eag_id}_{device_key}"
+            )
+            self._state_signal_for[device_key] = signal
+        return signal
+
+    @callback
+    def _notify_state_update(self, device_key: str, device: EnOceanDevice) -> None:
+        """Notify dispatcher subscribers and direct listeners of a state update."""
+        async_dispatcher_send(self.hass, self.state_signal(device_key), device)
+
+        # Copy: a listener may unregister itself while being called
+        for update_callback in tuple(self._state_listeners.get(device_key, ())):
+            update_callback(device)
 
     # ──────────────────────────────────────────────────────────────────────
     # Command sending
@@ -709,17 +775,11 @@ class OpusGreenNetCoordinator:
         functions: list[dict[str, Any]],
     ) -> None:
         """Send a command to a device using JSON state message."""
-        topic = TOPIC_PUT_STATE.format(
-            base=TOPIC_BASE, eag_id=self.eag_id, device_id=device_id
-        )
+        topic = self.topics.put_state(device_id)
 
-        state_message = {
-            "state": {
-                "functions": functions,
-            }
-        }
-
-        payload = json.dumps(state_message)
+        payload = (
+            _STATE_PAYLOAD_PREFIX + json_dumps(functions) + _STATE_PAYLOAD_SUFFIX
+        )
         _LOGGER.debug("Sending command to %s: %s", topic, payload)
 
         try:
@@ -832,20 +892,13 @@ class OpusGreenNetCoordinator:
 
     async def async_get_device_profile(self, device_id: str) -> None:
         """Request device profile from gateway."""
-        topic = TOPIC_GET_DEVICE_PROFILE.format(
-            base=TOPIC_BASE, eag_id=self.eag_id, device_id=device_id
-        )
-        answer_topic = TOPIC_GET_ANSWER_DEVICE_PROFILE.format(
-            base=TOPIC_BASE, eag_id=self.eag_id, device_id=device_id
-        )
+        topic = self.topics.get_device(device_id, "profile")
+        answer_topic = self.topics.get_answer_device(device_id, "profile")
 
         @callback
         def handle_profile(msg: ReceiveMessage) -> None:
             try:
-                payload = msg.payload
-                if isinstance(payload, bytes):
-                    payload = payload.decode()
-                data = json.loads(payload)
+                data = json_loads(msg.payload)
 
                 # Store profile on device
                 for dev in self.devices.values():
@@ -870,12 +923,8 @@ class OpusGreenNetCoordinator:
         """Get device configuration via ReCom API."""
         import asyncio
 
-        topic = TOPIC_GET_DEVICE_CONFIGURATION.format(
-            base=TOPIC_BASE, eag_id=self.eag_id, device_id=device_id
-        )
-        answer_topic = TOPIC_GET_ANSWER_DEVICE_CONFIGURATION.format(
-            base=TOPIC_BASE, eag_id=self.eag_id, device_id=device_id
-        )
+        topic = self.topics.get_device(device_id, "configuration")
+        answer_topic = self.topics.get_answer_device(device_id, "configuration")
 
         result: dict[str, Any] | None = None
         event = asyncio.Event()
@@ -884,10 +933,7 @@ class OpusGreenNetCoordinator:
         def handle_response(msg: ReceiveMessage) -> None:
             nonlocal result
             try:
-                payload = msg.payload
-                if isinstance(payload, bytes):
-                    payload = payload.decode()
-                result = json.loads(payload)
+                result = json_loads(msg.payload)
             except (json.JSONDecodeError, Exception) as err:
                 _LOGGER.debug("Could not parse device configuration: %s", err)
             event.set()
@@ -908,10 +954,8 @@ class OpusGreenNetCoordinator:
         self, device_id: str, config: dict[str, Any]
     ) -> bool:
         """Set device configuration via ReCom API."""
-        topic = TOPIC_PUT_DEVICE_CONFIGURATION.format(
-            base=TOPIC_BASE, eag_id=self.eag_id, device_id=device_id
-        )
-        payload = json.dumps(config)
+        topic = self.topics.put_device(device_id, "configuration")
+        payload = json_dumps(config)
         try:
             await mqtt.async_publish(self.hass, topic, payload, qos=1)
             return True
@@ -923,10 +967,8 @@ class OpusGreenNetCoordinator:
         """Get device DDF parameters via ReCom API."""
         import asyncio
 
-        topic = TOPIC_GET_DEVICE_PARAMETERS.format(
-            base=TOPIC_BASE, eag_id=self.eag_id, device_id=device_id
-        )
-        answer_topic = f"EnOcean/{self.eag_id}/getAnswer/devices/{device_id}/parameters"
+        topic = self.topics.get_device(device_id, "parameters")
+        answer_topic = self.topics.get_answer_device(device_id, "parameters")
 
         result: dict[str, Any] | None = None
         event = asyncio.Event()
@@ -935,10 +977,7 @@ class OpusGreenNetCoordinator:
         def handle_response(msg: ReceiveMessage) -> None:
             nonlocal result
             try:
-                payload = msg.payload
-                if isinstance(payload, bytes):
-                    payload = payload.decode()
-                result = json.loads(payload)
+                result = json_loads(msg.payload)
             except (json.JSONDecodeError, Exception) as err:
                 _LOGGER.debug("Could not parse device parameters: %s", err)
             event.set()
@@ -965,8 +1004,14 @@ class OpusGreenNetCoordinator:
 
     def get_devices_by_type(self, entity_type: str) -> list[EnOceanDevice]:
         """Get all devices of a specific entity type."""
-        return [
-            device
-            for device in self.devices.values()
-            if device.entity_type == entity_type
-        ]
+        return list(self.devices_by_kind.get(entity_type, {}).values())
+
+    @property
+    def climate_devices(self) -> list[EnOceanDevice]:
+        """Return all discovered climate (HeatArea) devices."""
+        return self.get_devices_by_type("climate")
+
+    @property
+    def binary_sensor_devices(self) -> list[EnOceanDevice]:
+        """Return all devices that expose binary sensors (HeatArea only)."""
+        return self.climate_devices
@@ -17,11 +17,7 @@ from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .const import CONF_EAG_ID, DEFAULT_CHANNEL, DOMAIN
-from .coordinator import (
-    SIGNAL_DEVICE_DISCOVERED,
-    SIGNAL_DEVICE_STATE_UPDATE,
-    OpusGreenNetCoordinator,
-)
+from .coordinator import OpusGreenNetCoordinator
 from .enocean_device import EnOceanDevice
 
 _LOGGER = logging.getLogger(__name__)
@@ -66,7 +62,7 @@ async def async_setup_entry(
     entry.async_on_unload(
         async_dispatcher_connect(
             hass,
-            f"{SIGNAL_DEVICE_DISCOVERED}_{eag_id}",
+            coordinator.discovery_signal,
             async_add_cover,
         )
     )
@@ -123,7 +119,7 @@ class OpusGreenNetCover(CoverEntity):
         """Return device info."""
         return DeviceInfo(
             identifiers={(DOMAIN, f"{self._eag_id}_{self._device.device_id}")},
-            name=self._device.friendly_id or self._device.device_id,
+            name=self._device_key,
             manufacturer=self._device.manufacturer or "EnOcean",
             model=self._device.primary_eep or "Unknown",
             via_device=(DOMAIN, self._eag_id),
@@ -136,7 +132,7 @@ class OpusGreenNetCover(CoverEntity):
         0 is closed, 100 is fully open.
         OPUS uses inverted scale: 0 = fully open, 100 = fully closed.
         """
-        channel = self._device.channels.get(self._channel_id)
+        channel = self._device.get_channel(self._channel_id)
         if channel is None or channel.position is None:
             return None
         return 100 - channel.position
@@ -146,7 +142,7 @@ class OpusGreenNetCover(CoverEntity):
         """Return current tilt position of cover."""
         if not self._device.supports_tilt:
             return None
-        channel = self._device.channels.get(self._channel_id)
+        channel = self._device.get_channel(self._channel_id)
         return channel.angle if channel else None
 
     @property
@@ -233,7 +229,7 @@ class OpusGreenNetCover(CoverEntity):
         self.async_on_remove(
             async_dispatcher_connect(
                 self.hass,
-                f"{SIGNAL_DEVICE_STATE_UPDATE}_{self._eag_id}_{self._device_key}",
+                self._coordinator.state_signal(self._device_key),
                 self._handle_state_update,
             )
         )
@@ -1,13 +1,21 @@
 """EnOcean device representation for Opus GreenNet Bridge."""
 from __future__ import annotations
 
+import logging
+import math
+import sys
+from collections.abc import Callable
 from dataclasses import dataclass, field
-from typing import Any
+from functools import partial
+from typing import Any, Final, NamedTuple
 
 from .const import (
     BUTTON_KEYS,
+    CLIMATE_EEPS,
     DEFAULT_CHANNEL,
+    DIMMABLE_EEPS,
     EEP_MAPPINGS,
+    HeaterMode,
     KEY_ACTUATOR_DEACTIVATED,
     KEY_ACTUATOR_LOW_BATTERY,
     KEY_ACTUATOR_NOT_RESPONDING,
@@ -32,13 +40,21 @@ from .const import (
     KEY_TEMPERATURE_SETPOINT,
     KEY_THERMAL_MODE,
     KEY_WINDOW_OPEN,
+    MAX_CHANNELS,
     STATE_ON,
+    TILT_EEPS,
+    VALUE_NOT_AVAILABLE,
 )
 
+_LOGGER = logging.getLogger(__name__)
 
-@dataclass
+
+@dataclass(slots=True, eq=False)
 class EnOceanChannel:
-    """Represents a single channel of an EnOcean device."""
+    """Represents a single channel of an EnOcean device.
+
+    Channels compare by identity; there is one object per device channel.
+    """
 
     channel_id: int
     is_on: bool = False
@@ -51,7 +67,7 @@ class EnOceanChannel:
     # Climate fields
     temperature: float | None = None
     temperature_setpoint: float | None = None
-    heater_mode: str | None = None
+    heater_mode: HeaterMode | str | None = None  # str for values outside HeaterMode
     humidity: float | None = None
     window_open: bool | None = None
     summer_mode: bool | None = None
@@ -72,9 +88,243 @@ class EnOceanChannel:
     last_button_action: str | None = None
 
 
-@dataclass
+# ──────────────────────────────────────────────────────────────────────
+# Telegram function handlers
+# ──────────────────────────────────────────────────────────────────────
+
+_TelegramHandler = Callable[[EnOceanChannel, Any], None]
+
+_HEATER_MODES: dict[str, HeaterMode] = {mode.value: mode for mode in HeaterMode}
+
+
+def _as_int(value: Any) -> int | None:
+    """Coerce a telegram value to int, or None if it is not numeric.
+
+    Checks the value up front instead of catching ValueError, so malformed
+    telegrams don't pay for an exception.
+    """
+    # The coordinator already parses numeric payloads, so ints are the norm
+    if type(value) is int:
+        return value
+    if type(value) is str:
+        digits = value[1:] if value.startswith(("-", "+")) else value
+        return int(value) if digits.isdecimal() else None
+    if type(value) is float:
+        return int(value) if math.isfinite(value) else None
+    if isinstance(value, int):
+        return int(value)
+    return None
+
+
+def _as_float(value: Any) -> float | None:
+    """Coerce a telegram value to float, or None if it is not numeric."""
+    if type(value) is float:
+        return value
+    if type(value) is int:
+        return float(value)
+    try:
+        return float(value)
+    except (ValueError, TypeError):
+        return None
+
+
+def _as_bool(value: Any) -> bool:
+    """Coerce a "true"/"false" telegram value to bool."""
+    return value is True or value == "true"
+
+
+def _set_button(button: str, channel: EnOceanChannel, value: Any) -> None:
+    channel.last_button = button
+    channel.last_button_action = str(value) if value is not None else None
+
+
+def _set_switch(channel: EnOceanChannel, value: Any) -> None:
+    channel.is_on = value == STATE_ON
+
+
+def _set_dimmer(channel: EnOceanChannel, value: Any) -> None:
+    brightness = _as_int(value)
+    if brightness is not None:
+        channel.brightness = brightness
+        channel.is_on = brightness > 0
+
+
+def _set_heater_mode(channel: EnOceanChannel, value: Any) -> None:
+    mode = _HEATER_MODES.get(value) if type(value) is str else None
+    channel.heater_mode = mode if mode is not None else str(value)
+
+
+def _set_local_control(channel: EnOceanChannel, value: Any) -> None:
+    channel.local_control = value == STATE_ON
+
+
+def _int_setter(attr: str) -> _TelegramHandler:
+    """Build a handler storing the value as int in a channel field."""
+
+    def handler(channel: EnOceanChannel, value: Any) -> None:
+        number = _as_int(value)
+        if number is not None:
+            setattr(channel, attr, number)
+
+    return handler
+
+
+def _float_setter(attr: str) -> _TelegramHandler:
+    """Build a handler storing the value as float in a channel field.
+
+    Non-numeric values leave the field unchanged.
+    """
+
+    def handler(channel: EnOceanChannel, value: Any) -> None:
+        number = _as_float(value)
+        if number is not None:
+            setattr(channel, attr, number)
+
+    return handler
+
+
+def _flag_setter(attr: str) -> _TelegramHandler:
+    """Build a handler storing a "true"/"false" value as bool in a channel field."""
+
+    def handler(channel: EnOceanChannel, value: Any) -> None:
+        setattr(channel, attr, _as_bool(value))
+
+    return handler
+
+
+def _str_setter(attr: str) -> _TelegramHandler:
+    """Build a handler storing the value as str in a channel field."""
+
+    def handler(channel: EnOceanChannel, value: Any) -> None:
+        setattr(channel, attr, str(value))
+
+    return handler
+
+
+def _enum_setter(attr: str, known: tuple[str, ...]) -> _TelegramHandler:
+    """Build a handler storing the value as str in a channel field.
+
+    Known values are stored as one shared string; others as plain str.
+    """
+    canonical = {value: sys.intern(value) for value in known}
+
+    def handler(channel: EnOceanChannel, value: Any) -> None:
+        shared = canonical.get(value) if type(value) is str else None
+        setattr(channel, attr, shared if shared is not None else str(value))
+
+    return handler
+
+
+_THERMAL_MODES = ("heating", "cooling")
+# Error/warning states; "reset" means cleared
+_ERROR_STATES = ("reset", "info", "warning", "error")
+
+
+# Function key -> handler applying its value to a channel
+_TELEGRAM_HANDLERS: dict[str, _TelegramHandler] = {
+    **{button: partial(_set_button, button) for button in BUTTON_KEYS},
+    KEY_SWITCH: _set_switch,
+    KEY_DIMMER: _set_dimmer,
+    KEY_POSITION: _int_setter("position"),
+    KEY_ANGLE: _int_setter("angle"),
+    KEY_LOCAL_CONTROL: _set_local_control,
+    KEY_ENERGY: _float_setter("energy"),
+    KEY_POWER: _float_setter("power"),
+    # Climate keys
+    KEY_TEMPERATURE: _float_setter("temperature"),
+    KEY_TEMPERATURE_SETPOINT: _float_setter("temperature_setpoint"),
+    KEY_HEATER_MODE: _set_heater_mode,
+    KEY_HUMIDITY: _float_setter("humidity"),
+    KEY_WINDOW_OPEN: _flag_setter("window_open"),
+    KEY_SUMMER_MODE: _flag_setter("summer_mode"),
+    KEY_FEED_TEMPERATURE: _float_setter("feed_temperature"),
+    KEY_THERMAL_MODE: _enum_setter("thermal_mode", _THERMAL_MODES),
+    KEY_ENERGY_CONSUMPTION: _float_setter("energy_consumption"),
+    KEY_POWER_STATE: _str_setter("power_state"),
+    KEY_TEMPERATURE_ORIGIN: _str_setter("temperature_origin"),
+    # Error/warning states
+    KEY_ACTUATOR_DEACTIVATED: _enum_setter("actuator_deactivated", _ERROR_STATES),
+    KEY_ACTUATOR_LOW_BATTERY: _enum_setter("actuator_low_battery", _ERROR_STATES),
+    KEY_ACTUATOR_NOT_RESPONDING: _enum_setter("actuator_not_responding", _ERROR_STATES),
+    KEY_MISSING_TEMPERATURE: _enum_setter("missing_temperature", _ERROR_STATES),
+    KEY_CIRCUIT_IN_USE: _enum_setter("circuit_in_use", _ERROR_STATES),
+}
+
+# All known state keys for initial state application
+KNOWN_STATE_KEYS: Final = frozenset(_TELEGRAM_HANDLERS)
+
+# Rocker presses are recorded whatever their value, even a missing one
+_BUTTON_KEYS: Final = frozenset(BUTTON_KEYS)
+
+
+# Channel count of multi-channel actuators; all other EEPs have one channel
+_CHANNEL_COUNTS: dict[str, int] = {
+    "D2-01-04": 2,
+    "D2-01-05": 2,
+    "D2-01-06": 2,
+    "D2-01-07": 2,
+    "D2-01-08": 4,
+    "D2-01-09": 4,
+    "D2-01-0A": 4,
+    "D2-01-0B": 4,
+    "D2-01-0D": 8,
+    "D2-01-0E": 8,
+    "D2-01-0F": 8,
+    "D2-01-10": 8,
+    # Local Control variants: same channel count as their non-LC counterparts
+    # D2-01-11 = 2-ch switch with local control (same as D2-01-04/05)
+    # D2-01-12 = 2-ch dimmer with local control (same as D2-01-06/07)
+    "D2-01-11": 2,
+    "D2-01-12": 2,
+}
+
+_HEAT_AREA_TYPES: dict[str, str] = {
+    "D1-4B-05": "valve",
+    "D1-4B-06": "cositherm",
+    "D1-4B-07": "electro",
+}
+
+
+class EEPSpec(NamedTuple):
+    """Device attributes derived from the primary EEP."""
+
+    entity_type: str | None
+    channel_count: int
+    dimmable: bool
+    is_cover: bool
+    supports_tilt: bool
+    is_climate: bool
+    heat_area_type: str | None
+    setpoint_step: float
+
+
+def _eep_spec(eep: str | None) -> EEPSpec:
+    """Derive the EEPSpec for an EEP."""
+    mapping = EEP_MAPPINGS.get(eep)
+    return EEPSpec(
+        entity_type=mapping[0] if mapping else None,
+        channel_count=_CHANNEL_COUNTS.get(eep, 1),
+        dimmable=eep in DIMMABLE_EEPS,
+        is_cover=bool(eep) and eep.startswith("D2-05-"),
+        supports_tilt=eep in TILT_EEPS,
+        is_climate=eep in CLIMATE_EEPS,
+        heat_area_type=_HEAT_AREA_TYPES.get(eep),
+        # D1-4B-06 and D1-4B-07 both use 0.1
+        setpoint_step=0.5 if eep == "D1-4B-05" else 0.1,
+    )
+
+
+# Specs of all known EEPs, resolved at import
+_EEP_SPECS: dict[str, EEPSpec] = {eep: _eep_spec(eep) for eep in EEP_MAPPINGS}
+_NO_EEP_SPEC = _eep_spec(None)
+
+
+@dataclass(slots=True, eq=False)
 class EnOceanDevice:
-    """Represents an EnOcean device from the gateway."""
+    """Represents an EnOcean device from the gateway.
+
+    Devices compare by identity, like the channels they own.
+    """
 
     device_id: str
     friendly_id: str
@@ -83,120 +333,83 @@ class EnOceanDevice:
     physical_device: str = ""
     first_seen: str = ""
     last_seen: str = ""
-    dbm: int = 0
-    channels: dict[int, EnOceanChannel] = field(default_factory=dict)
+    dbm: int | None = None  # None until a telegram reported signal strength
+    # Indexed by channel ID; None until the channel has reported state
+    channels: list[EnOceanChannel | None] = field(default_factory=list)
     profile: dict[str, Any] | None = None
-
-    @property
-    def primary_eep(self) -> str | None:
-        """Get the primary EEP for this device."""
-        if self.eeps:
-            return self.eeps[0].get("eep")
-        return None
-
-    @property
-    def entity_type(self) -> str | None:
-        """Determine the entity type based on the primary EEP."""
-        eep = self.primary_eep
-        if eep and eep in EEP_MAPPINGS:
-            return EEP_MAPPINGS[eep][0]
-        return None
+    # Derived from eeps in __post_init__; eeps don't change after construction
+    primary_eep: str | None = field(init=False, default=None)
+    entity_type: str | None = field(init=False, default=None)
+    channel_count: int = field(init=False, default=1)
+    _spec: EEPSpec = field(init=False, default=_NO_EEP_SPEC, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Resolve the primary EEP and the attributes derived from it."""
+        eep = self.eeps[0].get("eep") if self.eeps else None
+        self.primary_eep = eep
+        spec = _EEP_SPECS.get(eep) if eep is not None else _NO_EEP_SPEC
+        if spec is None:
+            # Unknown EEP: derive on the fly, e.g. for the D2-05 cover prefix
+            spec = _eep_spec(eep)
+        self._spec = spec
+        self.entity_type = spec.entity_type
+        self.channel_count = spec.channel_count
+        if not self.channels:
+            self.channels = [None] * self.channel_count
 
     @property
     def is_dimmable(self) -> bool:
         """Check if this device supports dimming."""
-        eep = self.primary_eep
-        if eep:
-            return eep in [
-                "D2-01-02",
-                "D2-01-03",
-                "D2-01-06",
-                "D2-01-07",
-                "D2-01-0A",
-                "D2-01-0B",
-                "D2-01-0F",
-                "D2-01-10",
-                "D2-01-12",
-                "A5-38-08",
-            ]
-        return False
+        return self._spec.dimmable
 
     @property
     def is_cover(self) -> bool:
         """Check if this device is a cover/blind."""
-        eep = self.primary_eep
-        if eep:
-            return eep.startswith("D2-05-")
-        return False
+        return self._spec.is_cover
 
     @property
     def supports_tilt(self) -> bool:
         """Check if this cover supports tilt/angle control."""
-        eep = self.primary_eep
-        return eep in ["D2-05-00", "D2-05-02"]
+        return self._spec.supports_tilt
 
     @property
     def is_climate(self) -> bool:
         """Check if this device is a climate/heating device."""
-        eep = self.primary_eep
-        if eep:
-            return eep in ["D1-4B-05", "D1-4B-06", "D1-4B-07"]
-        return False
+        return self._spec.is_climate
 
     @property
     def heat_area_type(self) -> str | None:
         """Return the specific heat area type."""
-        eep = self.primary_eep
-        eep_type_map = {
-            "D1-4B-05": "valve",
-            "D1-4B-06": "cositherm",
-            "D1-4B-07": "electro",
-        }
-        return eep_type_map.get(eep)
+        return self._spec.heat_area_type
 
     @property
     def setpoint_step(self) -> float:
         """Return the temperature setpoint step size for this device."""
-        if self.primary_eep == "D1-4B-05":
-            return 0.5
-        return 0.1  # D1-4B-06 and D1-4B-07 both use 0.1
-
-    @property
-    def channel_count(self) -> int:
-        """Determine the number of channels based on EEP."""
-        eep = self.primary_eep
-        if not eep:
-            return 1
-
-        # Multi-channel actuators
-        channel_map = {
-            "D2-01-04": 2,
-            "D2-01-05": 2,
-            "D2-01-06": 2,
-            "D2-01-07": 2,
-            "D2-01-08": 4,
-            "D2-01-09": 4,
-            "D2-01-0A": 4,
-            "D2-01-0B": 4,
-            "D2-01-0D": 8,
-            "D2-01-0E": 8,
-            "D2-01-0F": 8,
-            "D2-01-10": 8,
-            # Local Control variants: same channel count as their non-LC counterparts
-            # D2-01-11 = 2-ch switch with local control (same as D2-01-04/05)
-            # D2-01-12 = 2-ch dimmer with local control (same as D2-01-06/07)
-            "D2-01-11": 2,
-            "D2-01-12": 2,
-        }
-        return channel_map.get(eep, 1)
+        return self._spec.setpoint_step
 
     def get_or_create_channel(
         self, channel_id: int = DEFAULT_CHANNEL
     ) -> EnOceanChannel:
-        """Get or create a channel for this device."""
-        if channel_id not in self.channels:
-            self.channels[channel_id] = EnOceanChannel(channel_id=channel_id)
-        return self.channels[channel_id]
+        """Get or create a channel for this device.
+
+        Raises ValueError for IDs outside 0..MAX_CHANNELS-1.
+        """
+        if not 0 <= channel_id < MAX_CHANNELS:
+            raise ValueError(f"Channel {channel_id} out of range")
+        channels = self.channels
+        if channel_id >= len(channels):
+            # Channel ID beyond the EEP's channel count
+            channels.extend([None] * (channel_id + 1 - len(channels)))
+        channel = channels[channel_id]
+        if channel is None:
+            channel = channels[channel_id] = EnOceanChannel(channel_id=channel_id)
+        return channel
+
+    def get_channel(self, channel_id: int = DEFAULT_CHANNEL) -> EnOceanChannel | None:
+        """Get a channel, or None if it has not reported state yet."""
+        if 0 <= channel_id < len(self.channels):
+            return self.channels[channel_id]
+        return None
 
     def update_from_telegram(self, telegram: dict[str, Any]) -> None:
         """Update device state from a telegram message."""
@@ -204,16 +417,38 @@ class EnOceanDevice:
         if isinstance(functions, dict):
             functions = [functions]
 
-        # Determine channel from telegram
-        channel_id = DEFAULT_CHANNEL
+        # Single pass: resolve the channel and collect the state updates
+        channel_id: int | None = None
+        updates: list[tuple[_TelegramHandler, Any]] = []
         for func in functions:
-            if func.get("key") == KEY_CHANNEL:
-                try:
-                    channel_id = int(func.get("value", DEFAULT_CHANNEL))
-                except (ValueError, TypeError):
-                    channel_id = DEFAULT_CHANNEL
-                break
-
+            key = func.get("key")
+            if key == KEY_CHANNEL:
+                # The first channel function decides
+                if channel_id is None:
+                    channel_id = _as_int(func.get("value", DEFAULT_CHANNEL))
+                    if channel_id is None:
+                        channel_id = DEFAULT_CHANNEL
+                continue
+            handler = _TELEGRAM_HANDLERS.get(key)
+            if handler is None:
+                continue
+            value = func.get("value")
+            # Missing and not-yet-transmitted values leave the field unchanged
+            if (
+                value is None or value == VALUE_NOT_AVAILABLE
+            ) and key not in _BUTTON_KEYS:
+                continue
+            updates.append((handler, value))
+
+        if channel_id is None:
+            channel_id = DEFAULT_CHANNEL
+        elif not 0 <= channel_id < MAX_CHANNELS:
+            # Channel slots are a list; don't let a bogus ID size it or
+            # index it from the end
+            _LOGGER.debug(
+                "Ignoring telegram for %s with channel %s", self.device_id, channel_id
+            )
+            return
         channel = self.get_or_create_channel(channel_id)
 
         # Reset transient rocker fields so they only reflect the current telegram.
@@ -221,120 +456,8 @@ class EnOceanDevice:
         channel.last_button_action = None
 
         # Update channel state from functions
-        for func in functions:
-            key = func.get("key")
-            value = func.get("value")
-
-            if key in BUTTON_KEYS:
-                channel.last_button = key
-                channel.last_button_action = str(value) if value is not None else None
-
-            elif key == KEY_SWITCH:
-                channel.is_on = value == STATE_ON
-
-            elif key == KEY_DIMMER:
-                try:
-                    channel.brightness = int(value)
-                    channel.is_on = channel.brightness > 0
-                except (ValueError, TypeError):
-                    pass
-
-            elif key == KEY_POSITION:
-                try:
-                    channel.position = int(value)
-                except (ValueError, TypeError):
-                    pass
-
-            elif key == KEY_ANGLE:
-                try:
-                    channel.angle = int(value)
-                except (ValueError, TypeError):
-                    pass
-
-            elif key == KEY_LOCAL_CONTROL:
-                channel.local_control = value == STATE_ON
-
-            elif key == KEY_ENERGY:
-                try:
-                    channel.energy = float(value)
-                except (ValueError, TypeError):
-                    pass
-
-            elif key == KEY_POWER:
-                try:
-                    channel.power = float(value)
-                except (ValueError, TypeError):
-                    pass
-
-            # Climate keys
-            elif key == KEY_TEMPERATURE:
-                if value != "notAvailable":
-                    try:
-                        channel.temperature = float(value)
-                    except (ValueError, TypeError):
-                        pass
-
-            elif key == KEY_TEMPERATURE_SETPOINT:
-                if value != "notAvailable":
-                    try:
-                        channel.temperature_setpoint = float(value)
-                    except (ValueError, TypeError):
-                        pass
-
-            elif key == KEY_HEATER_MODE:
-                channel.heater_mode = str(value)
-
-            elif key == KEY_HUMIDITY:
-                if value != "notAvailable":
-                    try:
-                        channel.humidity = float(value)
-                    except (ValueError, TypeError):
-                        pass
-
-            elif key == KEY_WINDOW_OPEN:
-                channel.window_open = value == "true" or value is True
-
-            elif key == KEY_SUMMER_MODE:
-                channel.summer_mode = value == "true" or value is True
-
-            elif key == KEY_FEED_TEMPERATURE:
-                if value != "notAvailable":
-                    try:
-                        channel.feed_temperature = float(value)
-                    except (ValueError, TypeError):
-                        pass
-
-            elif key == KEY_THERMAL_MODE:
-                channel.thermal_mode = str(value)
-
-            elif key == KEY_ENERGY_CONSUMPTION:
-                if value != "notAvailable":
-                    try:
-                        channel.energy_consumption = float(value)
-                    except (ValueError, TypeError):
-                        pass
-
-            elif key == KEY_POWER_STATE:
-                channel.power_state = str(value)
-
-            elif key == KEY_TEMPERATURE_ORIGIN:
-                channel.temperature_origin = str(value)
-
-            # Error/warning states
-            elif key == KEY_ACTUATOR_DEACTIVATED:
-                channel.actuator_deactivated = str(value)
-
-            elif key == KEY_ACTUATOR_LOW_BATTERY:
-                channel.actuator_low_battery = str(value)
-
-            elif key == KEY_ACTUATOR_NOT_RESPONDING:
-                channel.actuator_not_responding = str(value)
-
-            elif key == KEY_MISSING_TEMPERATURE:
-                channel.missing_temperature = str(value)
-
-            elif key == KEY_CIRCUIT_IN_USE:
-                channel.circuit_in_use = str(value)
+        for handler, value in updates:
+            handler(channel, value)
 
         # Update last seen from telegram
         if "timestamp" in telegram:
@@ -357,7 +480,7 @@ class EnOceanDevice:
             physical_device=device.get("physicalDevice", ""),
             first_seen=device.get("firstSeen", ""),
             last_seen=device.get("lastSeen", ""),
-            dbm=device.get("dbm", 0),
+            dbm=device.get("dbm"),
         )
 
     def to_device_info(self, eag_id: str) -> dict[str, Any]:
@@ -2,13 +2,12 @@
 from __future__ import annotations
 
 import logging
+from typing import TYPE_CHECKING
 
 from homeassistant.components.event import EventEntity
-from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.core import callback
 from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity import DeviceInfo
-from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .const import (
     BUTTON_KEYS,
@@ -17,12 +16,14 @@ from .const import (
     CONF_EAG_ID,
     DOMAIN,
 )
-from .coordinator import (
-    SIGNAL_DEVICE_DISCOVERED,
-    SIGNAL_DEVICE_STATE_UPDATE,
-    OpusGreenNetCoordinator,
-)
-from .enocean_device import EnOceanDevice
+
+if TYPE_CHECKING:
+    from homeassistant.config_entries import ConfigEntry
+    from homeassistant.core import HomeAssistant
+    from homeassistant.helpers.entity_platform import AddEntitiesCallback
+
+    from .coordinator import OpusGreenNetCoordinator
+    from .enocean_device import EnOceanDevice
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -68,7 +69,7 @@ async def async_setup_entry(
     entry.async_on_unload(
         async_dispatcher_connect(
             hass,
-            f"{SIGNAL_DEVICE_DISCOVERED}_{eag_id}",
+            coordinator.discovery_signal,
             async_add_event,
         )
     )
@@ -98,16 +99,12 @@ class OpusGreenNetEvent(EventEntity):
 
         self._attr_unique_id = f"{eag_id}_{device.device_id}"
         self._attr_name = None  # Use device name
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device info."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, f"{self._eag_id}_{self._device.device_id}")},
-            name=self._device.friendly_id or self._device.device_id,
-            manufacturer=self._device.manufacturer or "EnOcean",
-            model=self._device.primary_eep or "Unknown",
-            via_device=(DOMAIN, self._eag_id),
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, f"{eag_id}_{device.device_id}")},
+            name=self._device_key,
+            manufacturer=device.manufacturer or "EnOcean",
+            model=device.primary_eep or "Unknown",
+            via_device=(DOMAIN, eag_id),
         )
 
     async def async_added_to_hass(self) -> None:
@@ -115,7 +112,7 @@ class OpusGreenNetEvent(EventEntity):
         self.async_on_remove(
             async_dispatcher_connect(
                 self.hass,
-                f"{SIGNAL_DEVICE_STATE_UPDATE}_{self._eag_id}_{self._device_key}",
+                self._coordinator.state_signal(self._device_key),
                 self._handle_state_update,
             )
         )
@@ -125,7 +122,7 @@ class OpusGreenNetEvent(EventEntity):
         """Handle state update from coordinator - fire event."""
         self._device = device
 
-        channel = device.channels.get(0)
+        channel = device.get_channel(0)
         if not channel:
             return
 
@@ -2,6 +2,8 @@
 from __future__ import annotations
 
 import logging
+from abc import abstractmethod
+from functools import partial
 from typing import Any
 
 from homeassistant.components.sensor import (
@@ -22,11 +24,7 @@ from homeassistant.helpers.entity import DeviceInfo, EntityCategory
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .const import CONF_EAG_ID, DEFAULT_CHANNEL, DOMAIN
-from .coordinator import (
-    SIGNAL_DEVICE_DISCOVERED,
-    SIGNAL_DEVICE_STATE_UPDATE,
-    OpusGreenNetCoordinator,
-)
+from .coordinator import OpusGreenNetCoordinator
 from .enocean_device import EnOceanDevice
 
 _LOGGER = logging.getLogger(__name__)
@@ -41,72 +39,61 @@ async def async_setup_entry(
     coordinator: OpusGreenNetCoordinator = hass.data[DOMAIN][entry.entry_id]
     eag_id = entry.data[CONF_EAG_ID]
 
-    @callback
-    def async_add_sensors(device: EnOceanDevice) -> None:
-        """Add sensor entities for a discovered device."""
-        entities: list[SensorEntity] = []
-
-        # Climate devices get humidity, feed temperature, and energy sensors
-        if device.is_climate:
-            # Humidity sensor (all HeatArea types)
-            entities.append(
-                OpusGreenNetHumiditySensor(
-                    coordinator=coordinator,
-                    eag_id=eag_id,
-                    device=device,
-                )
-            )
-
-            # Feed temperature (D1-4B-05 Valve Area only)
-            if device.primary_eep == "D1-4B-05":
-                entities.append(
-                    OpusGreenNetFeedTemperatureSensor(
-                        coordinator=coordinator,
-                        eag_id=eag_id,
-                        device=device,
-                    )
-                )
-
-            # Energy consumption (D1-4B-07 Electro Heating only)
-            if device.primary_eep == "D1-4B-07":
-                entities.append(
-                    OpusGreenNetEnergyConsumptionSensor(
-                        coordinator=coordinator,
-                        eag_id=eag_id,
-                        device=device,
-                    )
-                )
-
-        # Signal strength sensor (all devices with dbm data)
-        entities.append(
-            OpusGreenNetSignalStrengthSensor(
-                coordinator=coordinator,
-                eag_id=eag_id,
-                device=device,
-            )
-        )
-
-        if entities:
-            async_add_entities(entities)
-
     # Listen for new device discoveries
     entry.async_on_unload(
         async_dispatcher_connect(
             hass,
-            f"{SIGNAL_DEVICE_DISCOVERED}_{eag_id}",
-            async_add_sensors,
+            coordinator.discovery_signal,
+            partial(_async_add_sensors, coordinator, eag_id, async_add_entities),
+        )
+    )
+
+    # Add entities for already discovered devices in a single batch
+    if entities := [
+        entity
+        for device in coordinator.devices.values()
+        for entity in _build_entities(coordinator, eag_id, device)
+    ]:
+        async_add_entities(entities)
+
+
+def _build_entities(
+    coordinator: OpusGreenNetCoordinator, eag_id: str, device: EnOceanDevice
+) -> list[SensorEntity]:
+    """Build the sensor entities for a device."""
+    entities: list[SensorEntity] = [
+        sensor_class(coordinator=coordinator, eag_id=eag_id, device=device)
+        for sensor_class in _EEP_SENSORS.get(device.primary_eep, ())
+    ]
+
+    # Signal strength sensor (all devices with dbm data)
+    entities.append(
+        OpusGreenNetSignalStrengthSensor(
+            coordinator=coordinator,
+            eag_id=eag_id,
+            device=device,
         )
     )
 
-    # Add entities for already discovered devices
-    for device in coordinator.devices.values():
-        async_add_sensors(device)
+    return entities
+
+
+@callback
+def _async_add_sensors(
+    coordinator: OpusGreenNetCoordinator,
+    eag_id: str,
+    async_add_entities: AddEntitiesCallback,
+    device: EnOceanDevice,
+) -> None:
+    """Add sensor entities for a discovered device."""
+    async_add_entities(_build_entities(coordinator, eag_id, device))
 
 
 class OpusGreenNetBaseSensor(SensorEntity):
     """Base class for Opus GreenNet sensors."""
 
     _attr_has_entity_name = True
+    _attr_available = True
 
     def __init__(
         self,
@@ -121,31 +108,24 @@ class OpusGreenNetBaseSensor(SensorEntity):
         self._eag_id = eag_id
         self._device = device
         self._device_key = device.friendly_id or device.device_id
+        self._channel = device.get_channel(DEFAULT_CHANNEL)
+        self._attr_native_value = self._compute_value()
         self._attr_unique_id = f"{eag_id}_{device.device_id}_{suffix}"
         self._attr_name = name
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device info."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, f"{self._eag_id}_{self._device.device_id}")},
-            name=self._device.friendly_id or self._device.device_id,
-            manufacturer=self._device.manufacturer or "EnOcean",
-            model=self._device.primary_eep or "Unknown",
-            via_device=(DOMAIN, self._eag_id),
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, f"{eag_id}_{device.device_id}")},
+            name=self._device_key,
+            manufacturer=device.manufacturer or "EnOcean",
+            model=device.primary_eep or "Unknown",
+            via_device=(DOMAIN, eag_id),
         )
 
-    @property
-    def available(self) -> bool:
-        """Return if entity is available."""
-        return True
-
     async def async_added_to_hass(self) -> None:
         """Register callbacks when entity is added."""
         self.async_on_remove(
             async_dispatcher_connect(
                 self.hass,
-                f"{SIGNAL_DEVICE_STATE_UPDATE}_{self._eag_id}_{self._device_key}",
+                self._coordinator.state_signal(self._device_key),
                 self._handle_state_update,
             )
         )
@@ -153,9 +133,23 @@ class OpusGreenNetBaseSensor(SensorEntity):
     @callback
     def _handle_state_update(self, device: EnOceanDevice) -> None:
         """Handle state update from coordinator."""
-        self._device = device
+        # Channels are updated in place; rebind only for a new device object
+        # or a channel that has reported state for the first time
+        if device is not self._device or self._channel is None:
+            self._device = device
+            self._channel = device.get_channel(DEFAULT_CHANNEL)
+
+        # Most telegrams touch other values of the device; skip the state write then
+        value = self._compute_value()
+        if value == self._attr_native_value:
+            return
+        self._attr_native_value = value
         self.async_write_ha_state()
 
+    @abstractmethod
+    def _compute_value(self) -> Any:
+        """Return the sensor value from the current device state."""
+
 
 class OpusGreenNetHumiditySensor(OpusGreenNetBaseSensor):
     """Humidity sensor for HeatArea devices."""
@@ -173,10 +167,9 @@ class OpusGreenNetHumiditySensor(OpusGreenNetBaseSensor):
         """Initialize the humidity sensor."""
         super().__init__(coordinator, eag_id, device, "humidity", "Humidity")
 
-    @property
-    def native_value(self) -> float | None:
+    def _compute_value(self) -> float | None:
         """Return the humidity value."""
-        channel = self._device.channels.get(DEFAULT_CHANNEL)
+        channel = self._channel
         return channel.humidity if channel else None
 
 
@@ -198,10 +191,9 @@ class OpusGreenNetFeedTemperatureSensor(OpusGreenNetBaseSensor):
             coordinator, eag_id, device, "feed_temperature", "Feed temperature"
         )
 
-    @property
-    def native_value(self) -> float | None:
+    def _compute_value(self) -> float | None:
         """Return the feed temperature value."""
-        channel = self._device.channels.get(DEFAULT_CHANNEL)
+        channel = self._channel
         return channel.feed_temperature if channel else None
 
 
@@ -223,10 +215,9 @@ class OpusGreenNetEnergyConsumptionSensor(OpusGreenNetBaseSensor):
             coordinator, eag_id, device, "energy_consumption", "Energy consumption"
         )
 
-    @property
-    def native_value(self) -> float | None:
+    def _compute_value(self) -> float | None:
         """Return the energy consumption value."""
-        channel = self._device.channels.get(DEFAULT_CHANNEL)
+        channel = self._channel
         return channel.energy_consumption if channel else None
 
 
@@ -249,9 +240,15 @@ class OpusGreenNetSignalStrengthSensor(OpusGreenNetBaseSensor):
             coordinator, eag_id, device, "signal_strength", "Signal strength"
         )
 
-    @property
-    def native_value(self) -> int | None:
+    def _compute_value(self) -> int | None:
         """Return the signal strength value."""
-        if self._device.dbm:
-            return self._device.dbm
-        return None
+        return self._device.dbm
+
+
+# HeatArea sensors per EEP: humidity for all types, feed temperature for the
+# Valve Area (D1-4B-05), energy consumption for Electro Heating (D1-4B-07)
+_EEP_SENSORS: dict[str, tuple[type[OpusGreenNetBaseSensor], ...]] = {
+    "D1-4B-05": (OpusGreenNetHumiditySensor, OpusGreenNetFeedTemperatureSensor),
+    "D1-4B-06": (OpusGreenNetHumiditySensor,),
+    "D1-4B-07": (OpusGreenNetHumiditySensor, OpusGreenNetEnergyConsumptionSensor),
+}
@@ -12,11 +12,7 @@ from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .const import CONF_EAG_ID, DEFAULT_CHANNEL, DOMAIN
-from .coordinator import (
-    SIGNAL_DEVICE_DISCOVERED,
-    SIGNAL_DEVICE_STATE_UPDATE,
-    OpusGreenNetCoordinator,
-)
+from .coordinator import OpusGreenNetCoordinator
 from .enocean_device import EnOceanDevice
 
 _LOGGER = logging.getLogger(__name__)
@@ -61,7 +57,7 @@ async def async_setup_entry(
     entry.async_on_unload(
         async_dispatcher_connect(
             hass,
-            f"{SIGNAL_DEVICE_DISCOVERED}_{eag_id}",
+            coordinator.discovery_signal,
             async_add_switch,
         )
     )
@@ -105,7 +101,7 @@ class OpusGreenNetSwitch(SwitchEntity):
         """Return device info."""
         return DeviceInfo(
             identifiers={(DOMAIN, f"{self._eag_id}_{self._device.device_id}")},
-            name=self._device.friendly_id or self._device.device_id,
+            name=self._device_key,
             manufacturer=self._device.manufacturer or "EnOcean",
             model=self._device.primary_eep or "Unknown",
             via_device=(DOMAIN, self._eag_id),
@@ -114,7 +110,7 @@ class OpusGreenNetSwitch(SwitchEntity):
     @property
     def is_on(self) -> bool:
         """Return true if switch is on."""
-        channel = self._device.channels.get(self._channel_id)
+        channel = self._device.get_channel(self._channel_id)
         return channel.is_on if channel else False
 
     @property
@@ -145,7 +141,7 @@ class OpusGreenNetSwitch(SwitchEntity):
         self.async_on_remove(
             async_dispatcher_connect(
                 self.hass,
-                f"{SIGNAL_DEVICE_STATE_UPDATE}_{self._eag_id}_{self._device_key}",
+                self._coordinator.state_signal(self._device_key),
                 self._handle_state_update,
             )
         )
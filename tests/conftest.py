@@ -1,6 +1,7 @@
 """Shared fixtures for Opus GreenNet tests."""
 from __future__ import annotations
 
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
@@ -27,6 +28,32 @@ def make_device():
     return _make
 
 
+@pytest.fixture
+def valve_device():
+    """HeatArea Valve (D1-4B-05) device without reported state."""
+    return EnOceanDevice(
+        device_id="VALVE1",
+        friendly_id="Bathroom",
+        eeps=[{"eep": "D1-4B-05"}],
+    )
+
+
+@pytest.fixture
+def make_entity():
+    """Factory fixture for entities with a mocked state write."""
+
+    def _make(entity_class, device: EnOceanDevice):
+        entity = entity_class(
+            coordinator=MagicMock(),
+            eag_id="AABB0011",
+            device=device,
+        )
+        entity.async_write_ha_state = MagicMock()
+        return entity
+
+    return _make
+
+
 @pytest.fixture
 def make_telegram():
     """Factory fixture for creating telegram dicts."""
@@ -46,10 +73,18 @@ def make_telegram():
     return _make
 
 
-@pytest.fixture
-def coordinator():
-    """Create a coordinator with mocked hass and patched async_send_command."""
-    hass = MagicMock()
+@pytest.fixture(scope="module")
+def _module_coordinator():
+    """Create a coordinator with stub hass and patched async_send_command."""
+    # The command builders never touch hass; a plain namespace is enough
+    hass = SimpleNamespace(data={})
     c = OpusGreenNetCoordinator(hass, "AABB0011")
     c.async_send_command = AsyncMock()
     return c
+
+
+@pytest.fixture
+def coordinator(_module_coordinator):
+    """Share one coordinator per module, with a fresh async_send_command mock."""
+    _module_coordinator.async_send_command.reset_mock()
+    return _module_coordinator
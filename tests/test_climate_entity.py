@@ -0,0 +1,130 @@
+"""Tests for the OpusGreenNetClimate entity (HeatArea thermostats)."""
+from __future__ import annotations
+
+from unittest.mock import AsyncMock
+
+import pytest
+from homeassistant.components.climate import HVACAction, HVACMode
+
+from custom_components.opus_greennet.climate import OpusGreenNetClimate
+from custom_components.opus_greennet.enocean_device import EnOceanChannel, EnOceanDevice
+
+
+def test_extra_state_attributes_skip_unset_fields(valve_device, make_entity):
+    valve_device.channels[0] = EnOceanChannel(
+        channel_id=0,
+        window_open=False,
+        heater_mode="heating",
+    )
+
+    entity = make_entity(OpusGreenNetClimate, valve_device)
+
+    assert entity.extra_state_attributes == {
+        "window_open": False,
+        "heater_mode": "heating",
+    }
+
+
+def test_extra_state_attributes_only_active_errors(valve_device, make_entity):
+    valve_device.channels[0] = EnOceanChannel(
+        channel_id=0,
+        actuator_low_battery="warning",
+        actuator_not_responding="reset",
+        missing_temperature="",
+    )
+
+    entity = make_entity(OpusGreenNetClimate, valve_device)
+
+    assert entity.extra_state_attributes == {
+        "actuator_low_battery": "warning",
+    }
+
+
+def test_extra_state_attributes_empty_without_channel(valve_device, make_entity):
+    entity = make_entity(OpusGreenNetClimate, valve_device)
+
+    assert entity.extra_state_attributes == {}
+
+
+@pytest.mark.parametrize(
+    "eep,heater_mode,expected",
+    [
+        ("D1-4B-05", "heating", HVACMode.HEAT),
+        ("D1-4B-07", "on", HVACMode.HEAT),
+        ("D1-4B-06", "on", HVACMode.HEAT_COOL),
+        ("D1-4B-06", "heating", HVACMode.HEAT_COOL),
+        ("D1-4B-05", "off", HVACMode.OFF),
+        ("D1-4B-05", "autoOff", HVACMode.OFF),
+        ("D1-4B-05", None, HVACMode.OFF),
+    ],
+)
+def test_hvac_mode(eep, heater_mode, expected, make_entity):
+    device = EnOceanDevice(device_id="HA1", friendly_id="Area", eeps=[{"eep": eep}])
+    device.channels[0] = EnOceanChannel(channel_id=0, heater_mode=heater_mode)
+
+    assert make_entity(OpusGreenNetClimate, device).hvac_mode == expected
+
+
+@pytest.mark.parametrize(
+    "eep,heater_mode,thermal_mode,expected",
+    [
+        ("D1-4B-05", "heating", None, HVACAction.HEATING),
+        ("D1-4B-05", "heating", "cooling", HVACAction.HEATING),
+        ("D1-4B-06", "on", "heating", HVACAction.HEATING),
+        ("D1-4B-06", "on", "cooling", HVACAction.COOLING),
+        ("D1-4B-05", "autoOff", None, HVACAction.IDLE),
+        ("D1-4B-05", "off", None, HVACAction.OFF),
+        ("D1-4B-05", "configIncomplete", None, HVACAction.OFF),
+        ("D1-4B-05", "error", None, HVACAction.OFF),
+        ("D1-4B-05", "unknown", None, None),
+        ("D1-4B-05", None, None, None),
+    ],
+)
+def test_hvac_action(eep, heater_mode, thermal_mode, expected, make_entity):
+    device = EnOceanDevice(device_id="HA1", friendly_id="Area", eeps=[{"eep": eep}])
+    device.channels[0] = EnOceanChannel(
+        channel_id=0, heater_mode=heater_mode, thermal_mode=thermal_mode
+    )
+
+    assert make_entity(OpusGreenNetClimate, device).hvac_action == expected
+
+
+@pytest.mark.parametrize(
+    "eep,expected",
+    [("D1-4B-05", "heating"), ("D1-4B-07", "heating"), ("D1-4B-06", "on")],
+)
+async def test_set_hvac_mode_on_value(eep, expected, make_entity):
+    device = EnOceanDevice(device_id="HA1", friendly_id="Area", eeps=[{"eep": eep}])
+    entity = make_entity(OpusGreenNetClimate, device)
+    entity._coordinator.async_set_climate_mode = AsyncMock()
+
+    await entity.async_set_hvac_mode(entity.hvac_modes[0])
+
+    entity._coordinator.async_set_climate_mode.assert_awaited_once_with("HA1", expected)
+
+
+def test_hvac_action_none_without_channel(valve_device, make_entity):
+    assert make_entity(OpusGreenNetClimate, valve_device).hvac_action is None
+
+
+def test_device_info_built_at_init(valve_device, make_entity):
+    info = make_entity(OpusGreenNetClimate, valve_device).device_info
+
+    assert info["identifiers"] == {("opus_greennet", "AABB0011_VALVE1")}
+    assert info["name"] == "Bathroom"
+    assert info["manufacturer"] == "OPUS / EnOcean"
+    assert info["model"] == "D1-4B-05"
+    assert info["via_device"] == ("opus_greennet", "AABB0011")
+
+
+async def test_state_update_skips_write_when_unchanged(valve_device, make_entity):
+    valve_device.channels[0] = EnOceanChannel(channel_id=0, temperature=21.0)
+    entity = make_entity(OpusGreenNetClimate, valve_device)
+    await entity.async_added_to_hass()
+
+    entity._handle_state_update(valve_device)
+    entity.async_write_ha_state.assert_not_called()
+
+    valve_device.channels[0].temperature = 21.5
+    entity._handle_state_update(valve_device)
+    entity.async_write_ha_state.assert_called_once()
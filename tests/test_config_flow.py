@@ -1,7 +1,8 @@
 """Tests for the Opus GreenNet config flow."""
 from __future__ import annotations
 
-from unittest.mock import MagicMock, patch
+from types import SimpleNamespace
+from unittest.mock import patch
 
 import pytest
 
@@ -14,14 +15,13 @@ from custom_components.opus_greennet.config_flow import (
 
 @pytest.fixture
 def mock_hass():
-    """Create a mock HomeAssistant instance."""
-    return MagicMock()
+    """Create a stub HomeAssistant instance (only passed to the patched MQTT check)."""
+    return SimpleNamespace()
 
 
 class TestValidateInput:
     """Tests for the validate_input function."""
 
-    @pytest.mark.asyncio
     async def test_valid_hex_eag_id_accepted(self, mock_hass):
         """Valid 8-char hex EAG ID is accepted and uppercased."""
         with patch(
@@ -34,7 +34,6 @@ class TestValidateInput:
         assert "Opus GreenNet" in result["title"]
         assert "AABB0011" in result["title"]
 
-    @pytest.mark.asyncio
     async def test_invalid_eag_id_raises(self, mock_hass):
         """Non-hex or wrong-length EAG ID raises InvalidEagId."""
         with patch(
@@ -44,7 +43,6 @@ class TestValidateInput:
             with pytest.raises(InvalidEagId):
                 await validate_input(mock_hass, {"eag_id": "not-hex!"})
 
-    @pytest.mark.asyncio
     async def test_short_eag_id_raises(self, mock_hass):
         """EAG ID shorter than 8 chars raises InvalidEagId."""
         with patch(
@@ -54,7 +52,15 @@ class TestValidateInput:
             with pytest.raises(InvalidEagId):
                 await validate_input(mock_hass, {"eag_id": "AABB"})
 
-    @pytest.mark.asyncio
+    async def test_spaced_eag_id_raises(self, mock_hass):
+        """Hex bytes separated by spaces are rejected even at 8 chars."""
+        with patch(
+            "custom_components.opus_greennet.config_flow.mqtt.is_connected",
+            return_value=True,
+        ):
+            with pytest.raises(InvalidEagId):
+                await validate_input(mock_hass, {"eag_id": "AA BB CC"})
+
     async def test_mqtt_not_connected_raises(self, mock_hass):
         """If MQTT is not connected, CannotConnect is raised."""
         with patch(
@@ -1,72 +1,59 @@
 """Tests for coordinator pure helper functions and command building."""
 from __future__ import annotations
 
+import sys
+
 import pytest
 
 from custom_components.opus_greennet.coordinator import OpusGreenNetCoordinator
 
 
+@pytest.fixture(scope="module")
+def coord():
+    """Bare coordinator for helpers that never touch instance state."""
+    # _parse_value and _set_nested_property don't use self, so __new__ is safe
+    return OpusGreenNetCoordinator.__new__(OpusGreenNetCoordinator)
+
+
 # ── _parse_value ───────────────────────────────────────────────────────
 
 
 class TestParseValue:
     """Tests for OpusGreenNetCoordinator._parse_value."""
 
-    @pytest.fixture(autouse=True)
-    def _setup(self):
-        # _parse_value doesn't use self, so we can use __new__ safely
-        self.coord = OpusGreenNetCoordinator.__new__(OpusGreenNetCoordinator)
-
-    @pytest.mark.parametrize(
-        "input_val,expected",
-        [
-            ("true", True),
-            ("True", True),
-            ("TRUE", True),
-            ("false", False),
-            ("False", False),
-            ("FALSE", False),
-        ],
-    )
-    def test_booleans(self, input_val, expected):
-        assert self.coord._parse_value(input_val) is expected
-
-    @pytest.mark.parametrize(
-        "input_val,expected",
-        [
-            ("42", 42),
-            ("0", 0),
-            ("-5", -5),
-            ("100", 100),
-        ],
-    )
-    def test_integers(self, input_val, expected):
-        result = self.coord._parse_value(input_val)
-        assert result == expected
-        assert isinstance(result, int)
-
     @pytest.mark.parametrize(
-        "input_val,expected",
+        "input_val,expected,expected_type",
         [
-            ("3.14", 3.14),
-            ("-0.5", -0.5),
-            ("0.0", 0.0),
-            ("21.5", 21.5),
+            # Booleans (case-insensitive)
+            ("true", True, bool),
+            ("True", True, bool),
+            ("TRUE", True, bool),
+            ("false", False, bool),
+            ("False", False, bool),
+            ("FALSE", False, bool),
+            # Integers
+            ("42", 42, int),
+            ("0", 0, int),
+            ("-5", -5, int),
+            ("100", 100, int),
+            # Floats
+            ("3.14", 3.14, float),
+            ("-0.5", -0.5, float),
+            ("0.0", 0.0, float),
+            ("21.5", 21.5, float),
+            # Strings pass through
+            ("hello", "hello", str),
+            ("on", "on", str),
+            ("off", "off", str),
+            ("notAvailable", "notAvailable", str),
+            ("", "", str),
+            ("D2-01-02", "D2-01-02", str),
         ],
     )
-    def test_floats(self, input_val, expected):
-        result = self.coord._parse_value(input_val)
+    def test_parse_value(self, coord, input_val, expected, expected_type):
+        result = coord._parse_value(input_val)
         assert result == expected
-        assert isinstance(result, float)
-
-    @pytest.mark.parametrize(
-        "input_val",
-        ["hello", "on", "off", "notAvailable", "", "D2-01-02"],
-    )
-    def test_strings_passthrough(self, input_val):
-        result = self.coord._parse_value(input_val)
-        assert result == input_val
-        assert isinstance(result, str)
+        assert type(result) is expected_type
 
 
 # ── _set_nested_property ──────────────────────────────────────────────
@@ -75,94 +62,121 @@ class TestParseValue:
 class TestSetNestedProperty:
     """Tests for OpusGreenNetCoordinator._set_nested_property."""
 
-    @pytest.fixture(autouse=True)
-    def _setup(self):
-        self.coord = OpusGreenNetCoordinator.__new__(OpusGreenNetCoordinator)
-
-    def test_flat_property(self):
+    def test_flat_property(self, coord):
         data = {}
-        self.coord._set_nested_property(data, "eep", "D2-01-02")
+        coord._set_nested_property(data, "eep", "D2-01-02")
         assert data == {"eep": "D2-01-02"}
 
-    def test_nested_property(self):
+    def test_nested_property(self, coord):
         data = {}
-        self.coord._set_nested_property(data, "states/switch", "on")
+        coord._set_nested_property(data, "states/switch", "on")
         assert data["states"]["switch"] == "on"
 
-    def test_array_index(self):
+    def test_array_index(self, coord):
         data = {}
-        self.coord._set_nested_property(data, "eeps/0/eep", "D2-01-02")
+        coord._set_nested_property(data, "eeps/0/eep", "D2-01-02")
         assert data["eeps"][0]["eep"] == "D2-01-02"
 
-    def test_multiple_array_elements(self):
+    def test_multiple_array_elements(self, coord):
         data = {}
-        self.coord._set_nested_property(data, "eeps/0/eep", "D2-01-02")
-        self.coord._set_nested_property(data, "eeps/1/eep", "D2-01-03")
+        coord._set_nested_property(data, "eeps/0/eep", "D2-01-02")
+        coord._set_nested_property(data, "eeps/1/eep", "D2-01-03")
         assert data["eeps"][0]["eep"] == "D2-01-02"
         assert data["eeps"][1]["eep"] == "D2-01-03"
 
-    def test_functions_structure(self):
+    def test_functions_structure(self, coord):
         data = {}
-        self.coord._set_nested_property(data, "state/functions/0/key", "switch")
-        self.coord._set_nested_property(data, "state/functions/0/value", "on")
+        coord._set_nested_property(data, "state/functions/0/key", "switch")
+        coord._set_nested_property(data, "state/functions/0/value", "on")
         assert data["state"]["functions"][0]["key"] == "switch"
         # "on" stays as string (not parsed to bool) because _parse_value treats it as string
         assert data["state"]["functions"][0]["value"] == "on"
 
-    def test_deeply_nested(self):
+    def test_known_keys_and_function_keys_shared(self, coord):
+        data = {}
+        path = "/".join(["state", "functions", "0", "".join(["k", "ey"])])
+        coord._set_nested_property(data, path, "".join(["dim", "Value"]))
+        function = data["state"]["functions"][0]
+        key = next(iter(function))
+        assert key is sys.intern("key")
+        assert function[key] is sys.intern("dimValue")
+
+    def test_free_form_strings_kept_as_is(self, coord):
+        data = {}
+        name = "".join(["Living", " Room"])
+        coord._set_nested_property(data, "friendlyId", name)
+        assert data["friendlyId"] is name
+
+    def test_deeply_nested(self, coord):
         data = {}
-        self.coord._set_nested_property(data, "a/b/c", "deep")
+        coord._set_nested_property(data, "a/b/c", "deep")
         assert data["a"]["b"]["c"] == "deep"
 
-    def test_value_parsing_in_nested(self):
+    def test_value_parsing_in_nested(self, coord):
         data = {}
-        self.coord._set_nested_property(data, "dbm", "-65")
+        coord._set_nested_property(data, "dbm", "-65")
         assert data["dbm"] == -65
         assert isinstance(data["dbm"], int)
 
 
+# ── _as_list ──────────────────────────────────────────────────────────
+
+
+class TestAsList:
+    """Tests for coordinator._as_list."""
+
+    @pytest.mark.parametrize(
+        "data,expected",
+        [
+            (["a", "b"], ["a", "b"]),
+            ({"1": "b", "0": "a", "10": "k", "2": "c"}, ["a", "b", "c", "k"]),
+            ({}, []),
+            (None, []),
+            ("switch", []),
+        ],
+    )
+    def test_entries_in_index_order(self, data, expected):
+        from custom_components.opus_greennet.coordinator import _as_list
+
+        assert _as_list(data) == expected
+
+
 # ── Command building ──────────────────────────────────────────────────
 
 
 class TestCommandBuilding:
     """Tests for coordinator command builder methods."""
 
-    @pytest.mark.asyncio
     async def test_turn_on_switch(self, coordinator):
         await coordinator.async_turn_on("DEV1", channel=0)
         coordinator.async_send_command.assert_called_once_with(
             "DEV1", [{"key": "switch", "value": "on"}]
         )
 
-    @pytest.mark.asyncio
     async def test_turn_on_dimmer_no_brightness(self, coordinator):
         await coordinator.async_turn_on("DEV1", channel=0, is_dimmable=True)
         coordinator.async_send_command.assert_called_once_with(
             "DEV1", [{"key": "dimValue", "value": "100"}]
         )
 
-    @pytest.mark.asyncio
     async def test_turn_on_dimmer_with_brightness(self, coordinator):
         await coordinator.async_turn_on("DEV1", channel=0, brightness=50, is_dimmable=True)
         coordinator.async_send_command.assert_called_once_with(
             "DEV1", [{"key": "dimValue", "value": "50"}]
         )
 
-    @pytest.mark.asyncio
     async def test_turn_off_switch(self, coordinator):
         await coordinator.async_turn_off("DEV1", channel=0)
         coordinator.async_send_command.assert_called_once_with(
             "DEV1", [{"key": "switch", "value": "off"}]
         )
 
-    @pytest.mark.asyncio
     async def test_turn_off_dimmer(self, coordinator):
         await coordinator.async_turn_off("DEV1", channel=0, is_dimmable=True)
         coordinator.async_send_command.assert_called_once_with(
             "DEV1", [{"key": "dimValue", "value": "0"}]
         )
 
-    @pytest.mark.asyncio
     async def test_turn_on_with_channel(self, coordinator):
         await coordinator.async_turn_on("DEV1", channel=2)
         coordinator.async_send_command.assert_called_once_with(
@@ -170,7 +184,6 @@ class TestCommandBuilding:
             [{"key": "switch", "value": "on"}, {"key": "channel", "value": "2"}],
         )
 
-    @pytest.mark.asyncio
     async def test_turn_on_channel_zero_no_channel_key(self, coordinator):
         await coordinator.async_turn_on("DEV1", channel=0)
         args = coordinator.async_send_command.call_args[0]
@@ -178,42 +191,36 @@ class TestCommandBuilding:
         keys = [f["key"] for f in functions]
         assert "channel" not in keys
 
-    @pytest.mark.asyncio
     async def test_set_cover_position(self, coordinator):
         await coordinator.async_set_cover_position("DEV1", 75)
         coordinator.async_send_command.assert_called_once_with(
             "DEV1", [{"key": "position", "value": "75"}]
         )
 
-    @pytest.mark.asyncio
     async def test_set_cover_tilt(self, coordinator):
         await coordinator.async_set_cover_tilt("DEV1", 45)
         coordinator.async_send_command.assert_called_once_with(
             "DEV1", [{"key": "angle", "value": "45"}]
         )
 
-    @pytest.mark.asyncio
     async def test_stop_cover(self, coordinator):
         await coordinator.async_stop_cover("DEV1")
         coordinator.async_send_command.assert_called_once_with(
             "DEV1", [{"key": "position", "value": "stop"}]
         )
 
-    @pytest.mark.asyncio
     async def test_set_climate_setpoint(self, coordinator):
         await coordinator.async_set_climate_setpoint("DEV1", 22.5)
         coordinator.async_send_command.assert_called_once_with(
             "DEV1", [{"key": "temperatureSetpoint", "value": "22.5"}]
         )
 
-    @pytest.mark.asyncio
     async def test_set_climate_mode(self, coordinator):
         await coordinator.async_set_climate_mode("DEV1", "heating")
         coordinator.async_send_command.assert_called_once_with(
             "DEV1", [{"key": "heaterMode", "value": "heating"}]
         )
 
-    @pytest.mark.asyncio
     async def test_query_climate_status(self, coordinator):
         await coordinator.async_query_climate_status("DEV1")
         coordinator.async_send_command.assert_called_once_with(
@@ -228,7 +235,100 @@ class TestKnownStateKeys:
     """Regression guards for KNOWN_STATE_KEYS membership."""
 
     def test_includes_rocker_button_keys(self):
-        from custom_components.opus_greennet.const import BUTTON_KEYS, KNOWN_STATE_KEYS
+        from custom_components.opus_greennet.const import BUTTON_KEYS
+        from custom_components.opus_greennet.enocean_device import KNOWN_STATE_KEYS
 
         for key in BUTTON_KEYS:
             assert key in KNOWN_STATE_KEYS, f"{key} missing from KNOWN_STATE_KEYS"
+
+    def test_matches_telegram_handlers(self):
+        from custom_components.opus_greennet.enocean_device import (
+            _TELEGRAM_HANDLERS,
+            KNOWN_STATE_KEYS,
+        )
+
+        assert KNOWN_STATE_KEYS == _TELEGRAM_HANDLERS.keys()
+
+
+# ── parse_stream_topic ─────────────────────────────────────────────────
+
+
+class TestParseStreamTopic:
+    """Tests for const.parse_stream_topic."""
+
+    @pytest.mark.parametrize(
+        "topic,expected",
+        [
+            (
+                "EnOcean/AABB0011/stream/telegram/DEV1/from/functions/0/key",
+                ("telegram", "AABB0011", "DEV1", "from/functions/0/key"),
+            ),
+            (
+                "EnOcean/AABB0011/stream/devices/DEV1/eeps/0/eep",
+                ("devices", "AABB0011", "DEV1", "eeps/0/eep"),
+            ),
+            (
+                "EnOcean/AABB0011/stream/device/DEV1/states",
+                ("device", "AABB0011", "DEV1", "states"),
+            ),
+        ],
+    )
+    def test_splits_stream_topics(self, topic, expected):
+        from custom_components.opus_greennet.const import parse_stream_topic
+
+        assert parse_stream_topic(topic) == expected
+
+    @pytest.mark.parametrize(
+        "topic",
+        [
+            "EnOcean/AABB0011/stream/telegram/DEV1",
+            "EnOcean/AABB0011/stream/telegram/DEV1/",
+            "EnOcean/AABB0011/stream/telegram//from",
+            "EnOcean/AABB0011/getAnswer/devices/DEV1/state",
+            "Other/AABB0011/stream/telegram/DEV1/from",
+        ],
+    )
+    def test_rejects_other_topics(self, topic):
+        from custom_components.opus_greennet.const import parse_stream_topic
+
+        assert parse_stream_topic(topic) is None
+
+
+# ── TopicBuilder ───────────────────────────────────────────────────────
+
+
+class TestTopicBuilder:
+    """TopicBuilder must produce the same topics as the TOPIC_* patterns."""
+
+    @pytest.mark.parametrize(
+        "template,build",
+        [
+            ("TOPIC_SUB_TELEGRAM_FROM_ALL", lambda t: t.sub_telegram_all()),
+            ("TOPIC_SUB_DEVICE_STREAM_ALL", lambda t: t.sub_device_stream_all()),
+            ("TOPIC_SUB_DEVICES_ALL", lambda t: t.sub_devices_all()),
+            ("TOPIC_GET_ANSWER_DEVICES", lambda t: t.get_answer_devices()),
+            ("TOPIC_GET_DEVICES", lambda t: t.get_devices()),
+            ("TOPIC_GET_SYSTEM_INFO", lambda t: t.get_system_info()),
+            ("TOPIC_GET_ANSWER_SYSTEM_INFO", lambda t: t.get_answer_system_info()),
+            ("TOPIC_GET_SYSTEM_UPTIME", lambda t: t.get_system_uptime()),
+            ("TOPIC_GET_ANSWER_SYSTEM_UPTIME", lambda t: t.get_answer_system_uptime()),
+            ("TOPIC_PUT_STATE", lambda t: t.put_state("DEV1")),
+            ("TOPIC_GET_DEVICE_PROFILE", lambda t: t.get_device("DEV1", "profile")),
+            (
+                "TOPIC_GET_ANSWER_DEVICE_CONFIGURATION",
+                lambda t: t.get_answer_device("DEV1", "configuration"),
+            ),
+            (
+                "TOPIC_PUT_DEVICE_CONFIGURATION",
+                lambda t: t.put_device("DEV1", "configuration"),
+            ),
+        ],
+    )
+    def test_matches_topic_patterns(self, template, build):
+        from custom_components.opus_greennet import const
+
+        topics = const.TopicBuilder(const.TOPIC_BASE, "AABB0011")
+
+        assert build(topics) == getattr(const, template).format(
+            base=const.TOPIC_BASE, eag_id="AABB0011", device_id="DEV1"
+        )
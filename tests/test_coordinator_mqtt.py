@@ -2,7 +2,8 @@
 from __future__ import annotations
 
 import json
-from unittest.mock import AsyncMock, MagicMock, patch
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
 
 import pytest
 
@@ -10,12 +11,24 @@ from custom_components.opus_greennet.coordinator import OpusGreenNetCoordinator
 from custom_components.opus_greennet.enocean_device import EnOceanDevice
 
 
+@pytest.fixture(scope="module")
+def hass():
+    """Share one mocked hass per module; no test asserts on its calls."""
+    return MagicMock()
+
+
 @pytest.fixture
-def coord():
-    """Create a coordinator with mocked hass for MQTT tests."""
-    hass = MagicMock()
-    c = OpusGreenNetCoordinator(hass, "AABB0011")
-    return c
+def coord(hass):
+    """Create a fresh coordinator on the shared mocked hass for MQTT tests."""
+    return OpusGreenNetCoordinator(hass, "AABB0011")
+
+
+@pytest.fixture
+def light():
+    """Fresh dimmer for tests that route telegrams into its state."""
+    return EnOceanDevice(
+        device_id="DEV1", friendly_id="Light", eeps=[{"eep": "D2-01-02"}]
+    )
 
 
 # ── _finalize_telegram ────────────────────────────────────────────────
@@ -47,7 +60,7 @@ class TestFinalizeTelegram:
         device = coord.devices["My Light"]
         assert device.channels[0].is_on is True
 
-    def test_skips_to_only_telegram(self, coord):
+    def test_skips_to_only_telegram(self, coord, light):
         """Telegrams with only 'to' data (outbound commands) are skipped."""
         coord._telegram_data["DEV1"] = {
             "deviceId": "DEV1",
@@ -55,16 +68,14 @@ class TestFinalizeTelegram:
                 "functions": [{"key": "switch", "value": "on"}],
             },
         }
-        coord.devices["Light"] = EnOceanDevice(
-            device_id="DEV1", friendly_id="Light", eeps=[{"eep": "D2-01-02"}]
-        )
+        coord.devices["Light"] = light
 
         coord._finalize_telegram("DEV1")
 
         # Device state should NOT have changed
-        assert 0 not in coord.devices["Light"].channels or coord.devices["Light"].channels[0].is_on is False
+        assert coord.devices["Light"].get_channel(0) is None
 
-    def test_skips_direction_to(self, coord):
+    def test_skips_direction_to(self, coord, light):
         """Telegrams with direction='to' in effective data are skipped."""
         coord._telegram_data["DEV1"] = {
             "deviceId": "DEV1",
@@ -73,13 +84,11 @@ class TestFinalizeTelegram:
                 "functions": [{"key": "switch", "value": "on"}],
             },
         }
-        coord.devices["Light"] = EnOceanDevice(
-            device_id="DEV1", friendly_id="Light", eeps=[{"eep": "D2-01-02"}]
-        )
+        coord.devices["Light"] = light
 
         coord._finalize_telegram("DEV1")
 
-        assert 0 not in coord.devices["Light"].channels or coord.devices["Light"].channels[0].is_on is False
+        assert coord.devices["Light"].get_channel(0) is None
 
     def test_auto_discovers_unknown_device(self, coord):
         """If device not yet discovered, finalize auto-creates it."""
@@ -98,7 +107,7 @@ class TestFinalizeTelegram:
         assert device.device_id == "NEW1"
         assert device.channels[0].is_on is True
 
-    def test_functions_as_dict_from_flattened_mqtt(self, coord):
+    def test_functions_as_dict_from_flattened_mqtt(self, coord, light):
         """Functions may arrive as a dict (from _set_nested_property indexing)."""
         coord._telegram_data["DEV1"] = {
             "deviceId": "DEV1",
@@ -108,9 +117,7 @@ class TestFinalizeTelegram:
                 },
             },
         }
-        coord.devices["Light"] = EnOceanDevice(
-            device_id="DEV1", friendly_id="Light", eeps=[{"eep": "D2-01-02"}]
-        )
+        coord.devices["Light"] = light
 
         coord._finalize_telegram("DEV1")
 
@@ -128,11 +135,9 @@ class TestFinalizeTelegram:
 class TestFinalizeDeviceStream:
     """Tests for _finalize_device_stream processing."""
 
-    def test_state_functions_array_format(self, coord):
+    def test_state_functions_array_format(self, coord, light):
         """stream/device deltas use state.functions array format."""
-        coord.devices["Light"] = EnOceanDevice(
-            device_id="DEV1", friendly_id="Light", eeps=[{"eep": "D2-01-02"}]
-        )
+        coord.devices["Light"] = light
         coord._device_stream_data["DEV1"] = {
             "deviceId": "DEV1",
             "state": {
@@ -149,11 +154,9 @@ class TestFinalizeDeviceStream:
         assert ch.is_on is True
         assert ch.brightness == 50
 
-    def test_state_functions_dict_format(self, coord):
+    def test_state_functions_dict_format(self, coord, light):
         """state.functions may arrive as a dict from _set_nested_property."""
-        coord.devices["Light"] = EnOceanDevice(
-            device_id="DEV1", friendly_id="Light", eeps=[{"eep": "D2-01-02"}]
-        )
+        coord.devices["Light"] = light
         coord._device_stream_data["DEV1"] = {
             "deviceId": "DEV1",
             "state": {
@@ -167,11 +170,9 @@ class TestFinalizeDeviceStream:
 
         assert coord.devices["Light"].channels[0].is_on is True
 
-    def test_states_flat_dict_format(self, coord):
+    def test_states_flat_dict_format(self, coord, light):
         """Boot data uses states flat dict (key: value pairs)."""
-        coord.devices["Light"] = EnOceanDevice(
-            device_id="DEV1", friendly_id="Light", eeps=[{"eep": "D2-01-02"}]
-        )
+        coord.devices["Light"] = light
         coord._device_stream_data["DEV1"] = {
             "deviceId": "DEV1",
             "states": {
@@ -186,6 +187,25 @@ class TestFinalizeDeviceStream:
         assert ch.is_on is True
         assert ch.brightness == 80
 
+    def test_coalesces_listener_updates(self, coord, light):
+        """A multi-function delta notifies listeners once, not per function."""
+        coord.devices["Light"] = light
+        listener = MagicMock()
+        coord.register_listener("Light", listener)
+        coord._device_stream_data["DEV1"] = {
+            "deviceId": "DEV1",
+            "state": {
+                "functions": [
+                    {"key": "switch", "value": "on"},
+                    {"key": "dimValue", "value": "50"},
+                ],
+            },
+        }
+
+        coord._finalize_device_stream("DEV1")
+
+        listener.assert_called_once_with(coord.devices["Light"])
+
     def test_unknown_device_queued_for_discovery(self, coord):
         """Unknown device in stream data is queued for later discovery."""
         coord._device_stream_data["NEW1"] = {
@@ -203,56 +223,96 @@ class TestFinalizeDeviceStream:
         assert "NEW1" in coord._pending_devices
 
 
+# ── getAnswer/devices ────────────────────────────────────────────────
+
+
+class TestHandleGetAnswerDevices:
+    """Tests for _handle_get_answer_devices JSON parsing."""
+
+    def test_parses_bytes_payload(self, coord):
+        """Raw MQTT bytes go to the JSON parser without decoding first."""
+        payload = json.dumps(
+            {"devices": [{"deviceId": "DEV1", "friendlyId": "Light"}]}
+        ).encode()
+
+        with patch("custom_components.opus_greennet.coordinator.async_call_later"):
+            coord._handle_get_answer_devices(SimpleNamespace(payload=payload))
+
+        assert coord._device_data["DEV1"]["friendlyId"] == "Light"
+        assert "DEV1" in coord._pending_devices
+
+    def test_ignores_non_json_payload(self, coord):
+        with patch(
+            "custom_components.opus_greennet.coordinator.async_call_later"
+        ) as mock_later:
+            coord._handle_get_answer_devices(SimpleNamespace(payload=b"D2-01-02"))
+
+        assert coord._device_data == {}
+        mock_later.assert_not_called()
+
+
 # ── async_send_command ────────────────────────────────────────────────
 
 
+class _AsyncRecorder:
+    """Awaitable stand-in for mqtt.async_publish that records its calls.
+
+    Cheaper than AsyncMock, which introspects signatures on every call.
+    """
+
+    def __init__(self) -> None:
+        self.calls: list[tuple[tuple, dict]] = []
+
+    async def __call__(self, *args, **kwargs) -> None:
+        self.calls.append((args, kwargs))
+
+
 class TestAsyncSendCommand:
-    """Tests for async_send_command MQTT publishing."""
+    """Tests for async_send_command MQTT publishing.
+
+    hass is only handed to the patched mqtt.async_publish, so a plain
+    namespace stands in for it.
+    """
 
-    @pytest.mark.asyncio
     async def test_publishes_correct_json(self):
         """async_send_command publishes correct JSON to put/devices/{id}/state."""
-        hass = MagicMock()
-        coord = OpusGreenNetCoordinator(hass, "AABB0011")
+        coord = OpusGreenNetCoordinator(SimpleNamespace(data={}), "AABB0011")
 
         with patch(
             "custom_components.opus_greennet.coordinator.mqtt.async_publish",
-            new_callable=AsyncMock,
-        ) as mock_publish:
+            new=_AsyncRecorder(),
+        ) as publish:
             await coord.async_send_command(
                 "DEV1", [{"key": "switch", "value": "on"}]
             )
 
-            mock_publish.assert_called_once()
-            call_args = mock_publish.call_args
-            topic = call_args[0][1]  # positional: hass, topic, payload, ...
-            payload_str = call_args[0][2]
-            payload = json.loads(payload_str)
-
-            assert topic == "EnOcean/AABB0011/put/devices/DEV1/state"
-            assert payload == {
-                "state": {
-                    "functions": [{"key": "switch", "value": "on"}],
-                }
+        assert len(publish.calls) == 1
+        args, _ = publish.calls[0]
+        topic = args[1]  # positional: hass, topic, payload, ...
+        payload = json.loads(args[2])
+
+        assert topic == "EnOcean/AABB0011/put/devices/DEV1/state"
+        assert payload == {
+            "state": {
+                "functions": [{"key": "switch", "value": "on"}],
             }
+        }
 
-    @pytest.mark.asyncio
     async def test_publishes_with_qos_1(self):
         """Commands are published with QoS 1."""
-        hass = MagicMock()
-        coord = OpusGreenNetCoordinator(hass, "AABB0011")
+        coord = OpusGreenNetCoordinator(SimpleNamespace(data={}), "AABB0011")
 
         with patch(
             "custom_components.opus_greennet.coordinator.mqtt.async_publish",
-            new_callable=AsyncMock,
-        ) as mock_publish:
+            new=_AsyncRecorder(),
+        ) as publish:
             await coord.async_send_command(
                 "DEV1", [{"key": "dimValue", "value": "50"}]
             )
 
-            call_kwargs = mock_publish.call_args
-            # qos is passed as keyword or positional
-            assert call_kwargs[1].get("qos", call_kwargs[0][3] if len(call_kwargs[0]) > 3 else None) == 1
+        args, kwargs = publish.calls[0]
+        # qos is passed as keyword or positional
+        assert kwargs.get("qos", args[3] if len(args) > 3 else None) == 1
 
 
 # ── _finalize_discovery ──────────────────────────────────────────────
@@ -314,3 +374,118 @@ class TestFinalizeDiscovery:
 
         dev = coord.devices["Switch"]
         assert dev.primary_eep == "D2-01-00"
+
+    def test_indexes_devices_by_kind(self, coord):
+        """Discovered devices are partitioned by entity type."""
+        coord._device_data["DEV1"] = {
+            "deviceId": "DEV1",
+            "friendlyId": "Bathroom",
+            "eeps": [{"eep": "D1-4B-05"}],
+        }
+        coord._device_data["DEV2"] = {
+            "deviceId": "DEV2",
+            "friendlyId": "Dimmer",
+            "eeps": [{"eep": "D2-01-02"}],
+        }
+        coord._pending_devices.update({"DEV1", "DEV2"})
+
+        coord._finalize_discovery()
+
+        assert coord.climate_devices == [coord.devices["Bathroom"]]
+        assert coord.binary_sensor_devices == [coord.devices["Bathroom"]]
+        assert coord.get_devices_by_type("light") == [coord.devices["Dimmer"]]
+
+    def test_rediscovery_replaces_indexed_device(self, coord):
+        """A device rediscovered with EEPs moves out of the untyped state."""
+        coord._telegram_data["DEV1"] = {
+            "deviceId": "DEV1",
+            "from": {"friendlyId": "Bathroom", "functions": []},
+        }
+        coord._finalize_telegram("DEV1")
+        assert coord.climate_devices == []
+
+        coord._device_data["DEV1"] = {
+            "deviceId": "DEV1",
+            "friendlyId": "Bathroom",
+            "eeps": [{"eep": "D1-4B-05"}],
+        }
+        coord._pending_devices.add("DEV1")
+        coord._finalize_discovery()
+
+        assert coord.climate_devices == [coord.devices["Bathroom"]]
+
+    def test_climate_devices_announced_on_climate_signal(self, coord):
+        """Only climate devices are sent on the climate discovery signal."""
+        coord._device_data["DEV1"] = {
+            "deviceId": "DEV1",
+            "friendlyId": "Bathroom",
+            "eeps": [{"eep": "D1-4B-05"}],
+        }
+        coord._device_data["DEV2"] = {
+            "deviceId": "DEV2",
+            "friendlyId": "Dimmer",
+            "eeps": [{"eep": "D2-01-02"}],
+        }
+        coord._pending_devices.update({"DEV1", "DEV2"})
+
+        with patch(
+            "custom_components.opus_greennet.coordinator.async_dispatcher_send"
+        ) as mock_send:
+            coord._finalize_discovery()
+
+        sent = [(c.args[1], c.args[2].friendly_id) for c in mock_send.call_args_list]
+        assert (coord.climate_discovery_signal, "Bathroom") in sent
+        assert (coord.climate_discovery_signal, "Dimmer") not in sent
+        assert (coord.discovery_signal, "Dimmer") in sent
+
+
+# ── State listeners ──────────────────────────────────────────────────
+
+
+class TestStateListeners:
+    """Tests for direct per-device state listeners."""
+
+    def _telegram(self, coord):
+        coord._telegram_data["DEV1"] = {
+            "deviceId": "DEV1",
+            "from": {"functions": [{"key": "switch", "value": "on"}]},
+        }
+
+    def test_listener_called_on_telegram(self, coord, light):
+        coord.devices["Light"] = light
+        listener = MagicMock()
+        coord.register_listener("Light", listener)
+
+        self._telegram(coord)
+        coord._finalize_telegram("DEV1")
+
+        listener.assert_called_once_with(coord.devices["Light"])
+
+    def test_removed_listener_not_called(self, coord, light):
+        coord.devices["Light"] = light
+        listener = MagicMock()
+        remove = coord.register_listener("Light", listener)
+        remove()
+
+        self._telegram(coord)
+        coord._finalize_telegram("DEV1")
+
+        listener.assert_not_called()
+        assert "Light" not in coord._state_listeners
+
+    def test_listeners_scoped_to_device_key(self, coord, light):
+        coord.devices["Light"] = light
+        other = MagicMock()
+        coord.register_listener("Other", other)
+
+        self._telegram(coord)
+        coord._finalize_telegram("DEV1")
+
+        other.assert_not_called()
+
+    def test_state_signal_memoized_per_device(self, coord):
+        signal = coord.state_signal("Light")
+
+        assert signal == "opus_greennet_device_state_update_AABB0011_Light"
+        assert coord.state_signal("Light") is signal
+        assert coord.discovery_signal == "opus_greennet_device_discovered_AABB0011"
@@ -1,11 +1,15 @@
 """Tests for EnOceanDevice data model."""
 from __future__ import annotations
 
+import sys
+
 import pytest
 
+from custom_components.opus_greennet.const import HeaterMode
 from custom_components.opus_greennet.enocean_device import (
     EnOceanChannel,
     EnOceanDevice,
+    _as_int,
 )
 
 
@@ -133,10 +137,38 @@ class TestUpdateFromTelegram:
     def _device(self) -> EnOceanDevice:
         return EnOceanDevice(device_id="DEV1", friendly_id="Test", eeps=[{"eep": "D2-01-02"}])
 
-    def test_switch_on(self, make_telegram):
+    @pytest.mark.parametrize(
+        "key,value,attr,expected",
+        [
+            ("switch", "on", "is_on", True),
+            ("position", "50", "position", 50),
+            ("angle", "45", "angle", 45),
+            ("temperature", "21.5", "temperature", 21.5),
+            ("temperature", "notAvailable", "temperature", None),
+            ("temperatureSetpoint", "22.0", "temperature_setpoint", 22.0),
+            ("temperatureSetpoint", "notAvailable", "temperature_setpoint", None),
+            ("heaterMode", "heating", "heater_mode", HeaterMode.HEATING),
+            ("heaterMode", "boost", "heater_mode", "boost"),
+            ("humidity", "55", "humidity", 55.0),
+            ("humidity", "notAvailable", "humidity", None),
+            ("windowOpen", "true", "window_open", True),
+            ("windowOpen", True, "window_open", True),
+            ("windowOpen", "false", "window_open", False),
+            ("summerMode", "true", "summer_mode", True),
+            ("feedTemperature", "35.5", "feed_temperature", 35.5),
+            ("feedTemperature", "notAvailable", "feed_temperature", None),
+            ("energyConsumption", "1.5", "energy_consumption", 1.5),
+            ("powerState", "active", "power_state", "active"),
+            ("localControl", "on", "local_control", True),
+            ("dimValue", "abc", "brightness", None),
+        ],
+    )
+    def test_single_function(self, make_telegram, key, value, attr, expected):
         dev = self._device()
-        dev.update_from_telegram(make_telegram([{"key": "switch", "value": "on"}]))
-        assert dev.channels[0].is_on is True
+        dev.update_from_telegram(make_telegram([{"key": key, "value": value}]))
+        assert getattr(dev.channels[0], attr) == expected
+        if expected is None or isinstance(expected, bool):
+            assert getattr(dev.channels[0], attr) is expected
 
     def test_switch_off(self, make_telegram):
         dev = self._device()
@@ -156,96 +188,6 @@ class TestUpdateFromTelegram:
         assert dev.channels[0].brightness == 0
         assert dev.channels[0].is_on is False
 
-    def test_position(self, make_telegram):
-        dev = self._device()
-        dev.update_from_telegram(make_telegram([{"key": "position", "value": "50"}]))
-        assert dev.channels[0].position == 50
-
-    def test_angle(self, make_telegram):
-        dev = self._device()
-        dev.update_from_telegram(make_telegram([{"key": "angle", "value": "45"}]))
-        assert dev.channels[0].angle == 45
-
-    def test_temperature(self, make_telegram):
-        dev = self._device()
-        dev.update_from_telegram(make_telegram([{"key": "temperature", "value": "21.5"}]))
-        assert dev.channels[0].temperature == 21.5
-
-    def test_temperature_not_available(self, make_telegram):
-        dev = self._device()
-        dev.update_from_telegram(make_telegram([{"key": "temperature", "value": "notAvailable"}]))
-        assert dev.channels[0].temperature is None
-
-    def test_temperature_setpoint(self, make_telegram):
-        dev = self._device()
-        dev.update_from_telegram(make_telegram([{"key": "temperatureSetpoint", "value": "22.0"}]))
-        assert dev.channels[0].temperature_setpoint == 22.0
-
-    def test_temperature_setpoint_not_available(self, make_telegram):
-        dev = self._device()
-        dev.update_from_telegram(make_telegram([{"key": "temperatureSetpoint", "value": "notAvailable"}]))
-        assert dev.channels[0].temperature_setpoint is None
-
-    def test_heater_mode(self, make_telegram):
-        dev = self._device()
-        dev.update_from_telegram(make_telegram([{"key": "heaterMode", "value": "heating"}]))
-        assert dev.channels[0].heater_mode == "heating"
-
-    def test_humidity(self, make_telegram):
-        dev = self._device()
-        dev.update_from_telegram(make_telegram([{"key": "humidity", "value": "55"}]))
-        assert dev.channels[0].humidity == 55.0
-
-    def test_humidity_not_available(self, make_telegram):
-        dev = self._device()
-        dev.update_from_telegram(make_telegram([{"key": "humidity", "value": "notAvailable"}]))
-        assert dev.channels[0].humidity is None
-
-    def test_window_open_string(self, make_telegram):
-        dev = self._device()
-        dev.update_from_telegram(make_telegram([{"key": "windowOpen", "value": "true"}]))
-        assert dev.channels[0].window_open is True
-
-    def test_window_open_bool(self, make_telegram):
-        dev = self._device()
-        dev.update_from_telegram(make_telegram([{"key": "windowOpen", "value": True}]))
-        assert dev.channels[0].window_open is True
-
-    def test_window_closed(self, make_telegram):
-        dev = self._device()
-        dev.update_from_telegram(make_telegram([{"key": "windowOpen", "value": "false"}]))
-        assert dev.channels[0].window_open is False
-
-    def test_summer_mode(self, make_telegram):
-        dev = self._device()
-        dev.update_from_telegram(make_telegram([{"key": "summerMode", "value": "true"}]))
-        assert dev.channels[0].summer_mode is True
-
-    def test_feed_temperature(self, make_telegram):
-        dev = self._device()
-        dev.update_from_telegram(make_telegram([{"key": "feedTemperature", "value": "35.5"}]))
-        assert dev.channels[0].feed_temperature == 35.5
-
-    def test_feed_temperature_not_available(self, make_telegram):
-        dev = self._device()
-        dev.update_from_telegram(make_telegram([{"key": "feedTemperature", "value": "notAvailable"}]))
-        assert dev.channels[0].feed_temperature is None
-
-    def test_energy_consumption(self, make_telegram):
-        dev = self._device()
-        dev.update_from_telegram(make_telegram([{"key": "energyConsumption", "value": "1.5"}]))
-        assert dev.channels[0].energy_consumption == 1.5
-
-    def test_power_state(self, make_telegram):
-        dev = self._device()
-        dev.update_from_telegram(make_telegram([{"key": "powerState", "value": "active"}]))
-        assert dev.channels[0].power_state == "active"
-
-    def test_local_control(self, make_telegram):
-        dev = self._device()
-        dev.update_from_telegram(make_telegram([{"key": "localControl", "value": "on"}]))
-        assert dev.channels[0].local_control is True
-
     def test_energy_and_power(self, make_telegram):
         dev = self._device()
         dev.update_from_telegram(make_telegram([
@@ -262,10 +204,52 @@ class TestUpdateFromTelegram:
             {"key": "channel", "value": "1"},
         ]))
         # Channel 0 should not be affected
-        assert 0 not in dev.channels or dev.channels[0].is_on is False
+        assert dev.get_channel(0) is None
         # Channel 1 should be on
         assert dev.channels[1].is_on is True
 
+    def test_channel_key_position_independent(self, make_telegram):
+        dev = self._device()
+        dev.update_from_telegram(make_telegram([
+            {"key": "channel", "value": "1"},
+            {"key": "switch", "value": "on"},
+            {"key": "dimValue", "value": "40"},
+        ]))
+        assert dev.get_channel(0) is None
+        assert dev.channels[1].is_on is True
+        assert dev.channels[1].brightness == 40
+
+    def test_huge_channel_id_ignored(self, make_telegram):
+        dev = self._device()
+        dev.update_from_telegram(make_telegram([
+            {"key": "channel", "value": "1000000000"},
+            {"key": "switch", "value": "on"},
+        ]))
+        assert dev.channels == [None]
+
+    def test_negative_channel_id_ignored(self, make_telegram):
+        dev = self._device()
+        dev.channels[0] = EnOceanChannel(channel_id=0, is_on=True, brightness=30)
+        dev.update_from_telegram(make_telegram([
+            {"key": "channel", "value": "-1"},
+            {"key": "switch", "value": "off"},
+        ]))
+        ch = dev.channels[0]
+        assert ch.is_on is True
+        assert ch.brightness == 30
+        assert len(dev.channels) == 1
+
+    def test_only_enumerated_strings_shared(self, make_telegram):
+        dev = self._device()
+        origin = "".join(["sensor", "-42"])
+        dev.update_from_telegram(make_telegram([
+            {"key": "actuatorLowBattery", "value": "".join(["warn", "ing"])},
+            {"key": "temperatureOrigin", "value": origin},
+        ]))
+        ch = dev.channels[0]
+        assert ch.actuator_low_battery is sys.intern("warning")
+        assert ch.temperature_origin is origin
+
     def test_actuator_error_states(self, make_telegram):
         dev = self._device()
         dev.update_from_telegram(make_telegram([
@@ -278,10 +262,32 @@ class TestUpdateFromTelegram:
         assert ch.actuator_low_battery == "warning"
         assert ch.missing_temperature == "info"
 
-    def test_invalid_dim_value_no_crash(self, make_telegram):
+    def test_not_available_leaves_field_unchanged(self, make_telegram):
         dev = self._device()
-        dev.update_from_telegram(make_telegram([{"key": "dimValue", "value": "abc"}]))
-        assert dev.channels[0].brightness is None
+        dev.update_from_telegram(make_telegram([{"key": "heaterMode", "value": "heating"}]))
+        dev.update_from_telegram(make_telegram([
+            {"key": "heaterMode", "value": "notAvailable"},
+            {"key": "windowOpen", "value": None},
+        ]))
+        ch = dev.channels[0]
+        assert ch.heater_mode == "heating"
+        assert ch.window_open is None
+
+    def test_native_numeric_values(self, make_telegram):
+        """The coordinator hands over parsed ints/floats, not only strings."""
+        dev = self._device()
+        dev.update_from_telegram(make_telegram([
+            {"key": "dimValue", "value": 60},
+            {"key": "position", "value": "-5"},
+            {"key": "temperature", "value": 21},
+            {"key": "power", "value": 12.5},
+        ]))
+        ch = dev.channels[0]
+        assert ch.brightness == 60
+        assert ch.position == -5
+        assert ch.temperature == 21.0
+        assert isinstance(ch.temperature, float)
+        assert ch.power == 12.5
 
     def test_timestamp_updates(self):
         dev = self._device()
@@ -328,6 +334,13 @@ class TestUpdateFromTelegram:
         assert ch.last_button == key
         assert ch.last_button_action == value
 
+    def test_rocker_button_without_value_recorded(self, make_telegram):
+        dev = self._device()
+        dev.update_from_telegram(make_telegram([{"key": "buttonA0", "value": None}]))
+        ch = dev.channels[0]
+        assert ch.last_button == "buttonA0"
+        assert ch.last_button_action is None
+
     def test_rocker_button_cleared_on_next_non_button_telegram(self, make_telegram):
         dev = self._device()
         dev.update_from_telegram(make_telegram([{"key": "buttonA0", "value": "pressed"}]))
@@ -348,6 +361,31 @@ class TestUpdateFromTelegram:
         assert ch.last_button_action == "released"
 
 
+# ── value coercion ─────────────────────────────────────────────────────
+
+
+@pytest.mark.parametrize(
+    "value,expected",
+    [
+        (42, 42),
+        ("42", 42),
+        ("-5", -5),
+        ("+7", 7),
+        (12.9, 12),
+        (True, 1),
+        ("abc", None),
+        ("", None),
+        ("-", None),
+        ("1.5", None),
+        (float("nan"), None),
+        (float("inf"), None),
+        ([1], None),
+    ],
+)
+def test_as_int(value, expected):
+    assert _as_int(value) == expected
+
+
 # ── from_device_object ─────────────────────────────────────────────────
 
 
@@ -383,7 +421,7 @@ class TestFromDeviceObject:
         assert dev.device_id == ""
         assert dev.friendly_id == ""
         assert dev.eeps == []
-        assert dev.dbm == 0
+        assert dev.dbm is None
 
 
 # ── get_or_create_channel ──────────────────────────────────────────────
@@ -396,7 +434,20 @@ class TestGetOrCreateChannel:
         dev = EnOceanDevice(device_id="X", friendly_id="X")
         ch = dev.get_or_create_channel(0)
         assert ch.channel_id == 0
-        assert 0 in dev.channels
+        assert dev.channels[0] is ch
+
+    def test_slotted_without_instance_dict(self):
+        dev = EnOceanDevice(device_id="X", friendly_id="X")
+        ch = dev.get_or_create_channel(0)
+        assert not hasattr(dev, "__dict__")
+        assert not hasattr(ch, "__dict__")
+
+    def test_channels_compare_by_identity(self):
+        dev = EnOceanDevice(device_id="X", friendly_id="X")
+        ch = dev.get_or_create_channel(0)
+        assert ch == ch
+        assert ch != EnOceanChannel(channel_id=0)
+        assert {ch: True}[ch]
 
     def test_returns_existing(self):
         dev = EnOceanDevice(device_id="X", friendly_id="X")
@@ -405,3 +456,47 @@ class TestGetOrCreateChannel:
         ch2 = dev.get_or_create_channel(0)
         assert ch2.is_on is True
         assert ch1 is ch2
+
+    def test_slots_sized_by_channel_count(self, make_device):
+        dev = make_device("D2-01-08")
+        assert dev.channels == [None] * 4
+        assert dev.get_channel(3) is None
+
+    def test_creates_channel_beyond_channel_count(self):
+        dev = EnOceanDevice(device_id="X", friendly_id="X")
+        ch = dev.get_or_create_channel(2)
+        assert dev.get_channel(2) is ch
+        assert dev.get_channel(1) is None
+
+    def test_create_rejects_channel_past_cap(self):
+        dev = EnOceanDevice(device_id="X", friendly_id="X")
+        with pytest.raises(ValueError):
+            dev.get_or_create_channel(1_000_000_000)
+        assert dev.channels == [None]
+
+    def test_get_channel_out_of_range(self):
+        dev = EnOceanDevice(device_id="X", friendly_id="X")
+        assert dev.get_channel(5) is None
+        assert dev.get_channel(-1) is None
+
+
+# ── to_device_info ─────────────────────────────────────────────────────
+
+
+class TestToDeviceInfo:
+    """Tests for device info conversion."""
+
+    def test_device_info_fields(self, make_device):
+        dev = make_device("D2-01-02", device_id="DEV1", friendly_id="Dimmer")
+        info = dev.to_device_info("AABB0011")
+        assert info["identifiers"] == {("opus_greennet", "AABB0011_DEV1")}
+        assert info["name"] == "Dimmer"
+        assert info["manufacturer"] == "EnOcean"
+        assert info["model"] == "D2-01-02"
+        assert info["via_device"] == ("opus_greennet", "AABB0011")
+
+    def test_fresh_dict_per_call(self, make_device):
+        dev = make_device("D2-01-02")
+        info = dev.to_device_info("AABB0011")
+        info["name"] = "Changed"
+        assert dev.to_device_info("AABB0011")["name"] == "Test Device"
@@ -90,3 +90,12 @@ def test_no_event_for_unknown_button_action(event_entity, rocker_device):
     event_entity._handle_state_update(rocker_device)
 
     event_entity._trigger_event.assert_not_called()
+
+
+def test_device_info_built_at_init(event_entity):
+    info = event_entity.device_info
+
+    assert info["identifiers"] == {("opus_greennet", "AABB0011_ROCKER1")}
+    assert info["name"] == "Living Room Rocker"
+    assert info["model"] == "F6-02-01"
+    assert info["via_device"] == ("opus_greennet", "AABB0011")
@@ -0,0 +1,117 @@
+"""Tests for the Opus GreenNet sensor entities."""
+from __future__ import annotations
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from custom_components.opus_greennet.enocean_device import EnOceanChannel, EnOceanDevice
+from custom_components.opus_greennet.sensor import (
+    OpusGreenNetBaseSensor,
+    OpusGreenNetEnergyConsumptionSensor,
+    OpusGreenNetFeedTemperatureSensor,
+    OpusGreenNetHumiditySensor,
+    OpusGreenNetSignalStrengthSensor,
+    _build_entities,
+)
+
+
+@pytest.mark.parametrize(
+    "eep,expected",
+    [
+        (
+            "D1-4B-05",
+            [
+                OpusGreenNetHumiditySensor,
+                OpusGreenNetFeedTemperatureSensor,
+                OpusGreenNetSignalStrengthSensor,
+            ],
+        ),
+        ("D1-4B-06", [OpusGreenNetHumiditySensor, OpusGreenNetSignalStrengthSensor]),
+        (
+            "D1-4B-07",
+            [
+                OpusGreenNetHumiditySensor,
+                OpusGreenNetEnergyConsumptionSensor,
+                OpusGreenNetSignalStrengthSensor,
+            ],
+        ),
+        ("D2-01-12", [OpusGreenNetSignalStrengthSensor]),
+    ],
+)
+def test_entities_per_eep(eep, expected):
+    device = EnOceanDevice(device_id="DEV1", friendly_id="Dev", eeps=[{"eep": eep}])
+
+    entities = _build_entities(MagicMock(), "AABB0011", device)
+
+    assert [type(entity) for entity in entities] == expected
+
+
+def test_climate_values_read_from_default_channel(valve_device, make_entity):
+    valve_device.channels[0] = EnOceanChannel(
+        channel_id=0, humidity=55.0, feed_temperature=42.5
+    )
+
+    humidity = make_entity(OpusGreenNetHumiditySensor, valve_device)
+    feed_temperature = make_entity(OpusGreenNetFeedTemperatureSensor, valve_device)
+
+    assert humidity.native_value == 55.0
+    assert feed_temperature.native_value == 42.5
+
+
+def test_climate_values_none_without_channel(valve_device, make_entity):
+    assert make_entity(OpusGreenNetHumiditySensor, valve_device).native_value is None
+
+
+@pytest.mark.parametrize("dbm", [-72, 0, None])
+def test_signal_strength_passes_dbm_through(valve_device, dbm, make_entity):
+    valve_device.dbm = dbm
+
+    entity = make_entity(OpusGreenNetSignalStrengthSensor, valve_device)
+
+    assert entity.native_value == dbm
+
+
+def test_state_update_skips_write_when_unchanged(valve_device, make_entity):
+    valve_device.channels[0] = EnOceanChannel(channel_id=0, humidity=55.0)
+    entity = make_entity(OpusGreenNetHumiditySensor, valve_device)
+
+    valve_device.channels[0].temperature = 21.5
+    entity._handle_state_update(valve_device)
+    entity.async_write_ha_state.assert_not_called()
+
+    valve_device.channels[0].humidity = 60.0
+    entity._handle_state_update(valve_device)
+    entity.async_write_ha_state.assert_called_once()
+    assert entity.native_value == 60.0
+
+
+def test_state_update_picks_up_first_channel_report(valve_device, make_entity):
+    entity = make_entity(OpusGreenNetHumiditySensor, valve_device)
+    assert entity.native_value is None
+
+    valve_device.get_or_create_channel(0).humidity = 48.0
+    entity._handle_state_update(valve_device)
+
+    assert entity.native_value == 48.0
+    entity.async_write_ha_state.assert_called_once()
+
+
+def test_state_update_rebinds_channel_of_new_device_object(valve_device, make_entity):
+    valve_device.channels[0] = EnOceanChannel(channel_id=0, humidity=55.0)
+    entity = make_entity(OpusGreenNetHumiditySensor, valve_device)
+
+    rediscovered = EnOceanDevice(
+        device_id="VALVE1",
+        friendly_id="Bathroom",
+        eeps=[{"eep": "D1-4B-05"}],
+    )
+    rediscovered.channels[0] = EnOceanChannel(channel_id=0, humidity=61.0)
+    entity._handle_state_update(rediscovered)
+
+    assert entity.native_value == 61.0
+
+
+def test_base_sensor_requires_compute_value(valve_device):
+    with pytest.raises(TypeError):
+        OpusGreenNetBaseSensor(MagicMock(), "AABB0011", valve_device, "x", "X")